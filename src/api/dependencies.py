@@ -1,7 +1,9 @@
 """FastAPI dependencies for authentication and authorization."""
 
+import jwt
 from fastapi import Depends, HTTPException, Request, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from src.database.db import get_db
@@ -34,58 +36,61 @@ def get_current_user(
         User object for the authenticated user
 
     Raises:
-        HTTPException: 401 if token is invalid, expired, or user not found
+        HTTPException: 401 if token is invalid, expired, or user not found;
+            503 if the user cannot be loaded because the database is unavailable
     """
     token = credentials.credentials
 
     try:
         # Verify and decode the token
-        token_service = TokenService()
-        payload = token_service.verify_token(token)
-
-        # Check token type (must be access token)
-        token_type = payload.get("type")
-        if token_type != "access":
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token type",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        # Extract user ID from token
-        user_id_str = payload.get("sub")
-        if not user_id_str:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="Invalid token payload",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
-
-        user_id = int(user_id_str)
+        payload = TokenService.verify_token(token)
+    except (jwt.InvalidTokenError, ValueError) as e:
+        # Expired, malformed or badly signed; the reason stays out of the response
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Could not validate credentials",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from e
 
-        # Retrieve user from database
-        user_service = AuthUserService(db_session=db)
-        user = user_service.get_user_by_id(user_id)
+    # Check token type (must be access token)
+    token_type = payload.get("type")
+    if token_type != "access":
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token type",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        if not user:
-            raise HTTPException(
-                status_code=status.HTTP_401_UNAUTHORIZED,
-                detail="User not found",
-                headers={"WWW-Authenticate": "Bearer"},
-            )
+    # Extract user ID from token
+    user_id_str = payload.get("sub")
+    try:
+        user_id = int(user_id_str)
+    except (TypeError, ValueError):
+        user_id = None
+    if not user_id:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="Invalid token payload",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
 
-        return user
+    # Retrieve user from database; an unreachable database is not the client's fault
+    try:
+        user = AuthUserService(db_session=db).get_user_by_id(user_id)
+    except (SQLAlchemyError, TimeoutError) as e:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Service temporarily unavailable",
+        ) from e
 
-    except HTTPException:
-        # Re-raise HTTP exceptions as-is
-        raise
-    except Exception as e:
-        # Handle any other errors (expired token, invalid signature, etc.)
+    if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
-            detail=f"Could not validate credentials: {e}",
+            detail="User not found",
             headers={"WWW-Authenticate": "Bearer"},
-        ) from e
+        )
+
+    return user
 
 
 def get_csrf_service() -> CSRFService:
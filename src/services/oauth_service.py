@@ -6,7 +6,7 @@ from urllib.parse import urlencode
 
 import httpx
 
-from src.utils.config import config
+from src.utils.config import Config, config
 
 
 class OAuthService:
@@ -23,13 +23,15 @@ class OAuthService:
     GITHUB_EMAIL_URL = "https://api.github.com/user/emails"
 
     @staticmethod
-    def get_google_authorization_url(state: str | None = None) -> str:
+    def get_google_authorization_url(state: str | None = None, cfg: Config | None = None) -> str:
         """
         Generate Google OAuth authorization URL.
 
         Args:
             state: Optional state parameter for CSRF protection. If not provided,
                    a secure random state will be generated.
+            cfg: Optional configuration to read OAuth settings from
+                 (defaults to the application config)
 
         Returns:
             The authorization URL to redirect the user to
@@ -37,15 +39,16 @@ class OAuthService:
         Raises:
             ValueError: If Google OAuth is not configured
         """
-        if not config.oauth.google_client_id or not config.oauth.google_redirect_uri:
+        oauth = (cfg or config).oauth
+        if not oauth.google_client_id or not oauth.google_redirect_uri:
             raise ValueError("Google OAuth is not configured")
 
         if state is None:
             state = secrets.token_urlsafe(32)
 
         params = {
-            "client_id": config.oauth.google_client_id,
-            "redirect_uri": config.oauth.google_redirect_uri,
+            "client_id": oauth.google_client_id,
+            "redirect_uri": oauth.google_redirect_uri,
             "response_type": "code",
             "scope": "openid email profile",
             "state": state,
@@ -56,12 +59,14 @@ class OAuthService:
         return f"{OAuthService.GOOGLE_AUTH_URL}?{urlencode(params)}"
 
     @staticmethod
-    async def exchange_google_code(code: str) -> dict[str, Any]:
+    async def exchange_google_code(code: str, cfg: Config | None = None) -> dict[str, Any]:
         """
         Exchange Google authorization code for access token and user info.
 
         Args:
             code: The authorization code received from Google
+            cfg: Optional configuration to read OAuth settings from
+                 (defaults to the application config)
 
         Returns:
             A dictionary containing:
@@ -73,7 +78,8 @@ class OAuthService:
             ValueError: If Google OAuth is not configured or code is invalid
             httpx.HTTPError: If the API request fails
         """
-        if not config.oauth.google_client_id or not config.oauth.google_client_secret:
+        oauth = (cfg or config).oauth
+        if not oauth.google_client_id or not oauth.google_client_secret:
             raise ValueError("Google OAuth is not configured")
 
         if not code:
@@ -85,9 +91,9 @@ class OAuthService:
                 OAuthService.GOOGLE_TOKEN_URL,
                 data={
                     "code": code,
-                    "client_id": config.oauth.google_client_id,
-                    "client_secret": config.oauth.google_client_secret,
-                    "redirect_uri": config.oauth.google_redirect_uri,
+                    "client_id": oauth.google_client_id,
+                    "client_secret": oauth.google_client_secret,
+                    "redirect_uri": oauth.google_redirect_uri,
                     "grant_type": "authorization_code",
                 },
             )
@@ -125,13 +131,15 @@ class OAuthService:
             }
 
     @staticmethod
-    def get_github_authorization_url(state: str | None = None) -> str:
+    def get_github_authorization_url(state: str | None = None, cfg: Config | None = None) -> str:
         """
         Generate GitHub OAuth authorization URL.
 
         Args:
             state: Optional state parameter for CSRF protection. If not provided,
                    a secure random state will be generated.
+            cfg: Optional configuration to read OAuth settings from
+                 (defaults to the application config)
 
         Returns:
             The authorization URL to redirect the user to
@@ -139,15 +147,16 @@ class OAuthService:
         Raises:
             ValueError: If GitHub OAuth is not configured
         """
-        if not config.oauth.github_client_id or not config.oauth.github_redirect_uri:
+        oauth = (cfg or config).oauth
+        if not oauth.github_client_id or not oauth.github_redirect_uri:
             raise ValueError("GitHub OAuth is not configured")
 
         if state is None:
             state = secrets.token_urlsafe(32)
 
         params = {
-            "client_id": config.oauth.github_client_id,
-            "redirect_uri": config.oauth.github_redirect_uri,
+            "client_id": oauth.github_client_id,
+            "redirect_uri": oauth.github_redirect_uri,
             "scope": "user:email",
             "state": state,
         }
@@ -155,12 +164,14 @@ class OAuthService:
         return f"{OAuthService.GITHUB_AUTH_URL}?{urlencode(params)}"
 
     @staticmethod
-    async def exchange_github_code(code: str) -> dict[str, Any]:
+    async def exchange_github_code(code: str, cfg: Config | None = None) -> dict[str, Any]:
         """
         Exchange GitHub authorization code for access token and user info.
 
         Args:
             code: The authorization code received from GitHub
+            cfg: Optional configuration to read OAuth settings from
+                 (defaults to the application config)
 
         Returns:
             A dictionary containing:
@@ -172,7 +183,8 @@ class OAuthService:
             ValueError: If GitHub OAuth is not configured or code is invalid
             httpx.HTTPError: If the API request fails
         """
-        if not config.oauth.github_client_id or not config.oauth.github_client_secret:
+        oauth = (cfg or config).oauth
+        if not oauth.github_client_id or not oauth.github_client_secret:
             raise ValueError("GitHub OAuth is not configured")
 
         if not code:
@@ -184,9 +196,9 @@ class OAuthService:
                 OAuthService.GITHUB_TOKEN_URL,
                 data={
                     "code": code,
-                    "client_id": config.oauth.github_client_id,
-                    "client_secret": config.oauth.github_client_secret,
-                    "redirect_uri": config.oauth.github_redirect_uri,
+                    "client_id": oauth.github_client_id,
+                    "client_secret": oauth.github_client_secret,
+                    "redirect_uri": oauth.github_redirect_uri,
                 },
                 headers={"Accept": "application/json"},
             )
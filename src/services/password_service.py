@@ -4,6 +4,12 @@ import re
 
 import bcrypt
 
+# Character-class checks used by validate_password_strength, compiled once
+_UPPERCASE_RE = re.compile(r"[A-Z]")
+_LOWERCASE_RE = re.compile(r"[a-z]")
+_DIGIT_RE = re.compile(r"\d")
+_SPECIAL_RE = re.compile(r"[!@#$%^&*]")
+
 
 class PasswordService:
     """Service for password hashing, verification, and validation."""
@@ -90,16 +96,16 @@ class PasswordService:
         if len(password) < PasswordService.MIN_LENGTH:
             errors.append(f"Password must be at least {PasswordService.MIN_LENGTH} characters long")
 
-        if PasswordService.REQUIRE_UPPERCASE and not re.search(r"[A-Z]", password):
+        if PasswordService.REQUIRE_UPPERCASE and not _UPPERCASE_RE.search(password):
             errors.append("Password must contain at least one uppercase letter")
 
-        if PasswordService.REQUIRE_LOWERCASE and not re.search(r"[a-z]", password):
+        if PasswordService.REQUIRE_LOWERCASE and not _LOWERCASE_RE.search(password):
             errors.append("Password must contain at least one lowercase letter")
 
-        if PasswordService.REQUIRE_DIGIT and not re.search(r"\d", password):
+        if PasswordService.REQUIRE_DIGIT and not _DIGIT_RE.search(password):
             errors.append("Password must contain at least one digit")
 
-        if PasswordService.REQUIRE_SPECIAL and not re.search(r"[!@#$%^&*]", password):
+        if PasswordService.REQUIRE_SPECIAL and not _SPECIAL_RE.search(password):
             errors.append("Password must contain at least one special character (!@#$%^&*)")
 
         is_valid = len(errors) == 0
@@ -1,22 +1,66 @@
 """Rate limiting service for API endpoints."""
 
+import math
+import threading
 import time
-from collections import defaultdict
+from collections.abc import Callable
+
+NS_PER_SECOND = 1_000_000_000
+
+
+class _Shard:
+    """One stripe of rate limiter state, guarded by its own lock."""
+
+    __slots__ = ("blocked", "buckets", "lock")
+
+    def __init__(self):
+        # Format: {key: (spent_tokens, last_refill_ns, full_at_ns)}
+        self.buckets: dict[str, tuple[float, int, int]] = {}
+        # Negative cache of blocked checks until a token frees up
+        # Format: {(key, limit, window_seconds): (blocked_until_ns, reset_time)}
+        self.blocked: dict[tuple[str, int, int], tuple[int, int]] = {}
+        self.lock = threading.Lock()
 
 
 class RateLimiter:
     """
-    In-memory rate limiter using sliding window algorithm.
-
-    This implementation uses a sliding window approach to track requests
-    and enforce rate limits based on IP addresses or other keys.
+    In-memory rate limiter using the token bucket algorithm.
+
+    Each key owns a bucket of ``limit`` tokens that refills at
+    ``limit / window_seconds`` tokens per second; a request spends one token.
+    Buckets store the tokens spent rather than those left, so one key can be
+    checked against different limits (e.g. login and register share the
+    client IP). State per key is constant size, so every check is O(1).
+
+    A bucket that has refilled completely is equivalent to no bucket at all,
+    so such buckets are swept every ``SWEEP_INTERVAL`` checks to keep memory
+    bounded by the number of recently active clients.
+
+    Keys are striped across ``SHARD_COUNT`` shards, each with its own lock, so
+    threadpool-dispatched requests for different clients rarely contend.
+    Once a check is blocked, repeats of it are answered from a negative cache
+    without taking the lock until the next token is due.
     """
 
-    def __init__(self):
-        """Initialize the rate limiter with empty request tracking."""
-        # Dictionary to store request timestamps for each key
-        # Format: {key: [timestamp1, timestamp2, ...]}
-        self._requests: dict[str, list] = defaultdict(list)
+    # Number of is_allowed calls between sweeps of refilled buckets
+    SWEEP_INTERVAL = 4096
+    # Number of lock stripes; must be a power of two
+    SHARD_COUNT = 16
+
+    def __init__(self, clock: Callable[[], int] = time.monotonic_ns):
+        """
+        Initialize the rate limiter with empty bucket tracking.
+
+        Args:
+            clock: Monotonic clock returning integer nanoseconds; injectable for tests
+        """
+        self._clock = clock
+        # Bucket state striped by key hash, with times in monotonic nanoseconds
+        self._shards = [_Shard() for _ in range(self.SHARD_COUNT)]
+        # Unlocked on purpose: a lost increment only delays the next sweep
+        self._op_counter = 0
+        # Offset for turning monotonic times into the wall-clock reset_time
+        self._wall_offset_ns = time.time_ns() - clock()
 
     def is_allowed(self, key: str, limit: int, window_seconds: int) -> tuple[bool, dict]:
         """
@@ -32,65 +76,122 @@ class RateLimiter:
             - is_allowed: Boolean indicating if request is allowed
             - rate_info: Dictionary with rate limit information
         """
-        current_time = time.time()
-        window_start = current_time - window_seconds
-
-        # Clean up old requests outside the current window
-        self._requests[key] = [
-            timestamp for timestamp in self._requests[key] if timestamp > window_start
-        ]
-
-        # Count current requests in the window
-        current_count = len(self._requests[key])
-
-        # Calculate remaining requests
-        remaining = max(0, limit - current_count)
-
-        # Calculate reset time (when the oldest request will expire)
-        reset_time = int(current_time + window_seconds)
-        if self._requests[key]:
-            oldest_request = min(self._requests[key])
-            reset_time = int(oldest_request + window_seconds)
-
-        # Prepare rate limit information
+        now_ns = self._clock()
+
+        # A non-positive limit blocks everything without touching any state
+        if limit <= 0:
+            return False, {
+                "limit": limit,
+                "remaining": 0,
+                "reset_time": self._to_wall_seconds(now_ns) + window_seconds,
+                "window_seconds": window_seconds,
+                "retry_after": window_seconds,
+            }
+
+        shard = self._shard(key)
+
+        # Fast path for a client that is still blocked; dict reads are atomic
+        blocked = shard.blocked.get((key, limit, window_seconds))
+        if blocked is not None and now_ns < blocked[0]:
+            return False, {
+                "limit": limit,
+                "remaining": 0,
+                "reset_time": blocked[1],
+                "window_seconds": window_seconds,
+                "retry_after": max(1, math.ceil((blocked[0] - now_ns) / NS_PER_SECOND)),
+            }
+
+        # Nanoseconds needed to refill one token
+        ns_per_token = window_seconds * NS_PER_SECOND / limit
+
+        with shard.lock:
+            # Refill the bucket for the time elapsed since the last check
+            spent, last_refill_ns, _ = shard.buckets.get(key, (0.0, now_ns, now_ns))
+            spent = max(0.0, spent - (now_ns - last_refill_ns) / ns_per_token)
+
+            is_allowed = spent + 1 <= limit
+            if is_allowed:
+                spent += 1
+
+            full_at_ns = now_ns + int(spent * ns_per_token)
+            shard.buckets[key] = (spent, now_ns, full_at_ns)
+
+            if not is_allowed:
+                # Time until one whole token has been refilled
+                wait_ns = int((spent + 1 - limit) * ns_per_token)
+                reset_time = self._to_wall_seconds(full_at_ns)
+                shard.blocked[(key, limit, window_seconds)] = (now_ns + wait_ns, reset_time)
+
+        # Sweep outside the shard lock; sweeping takes every shard's lock in turn
+        self._op_counter += 1
+        if self._op_counter % self.SWEEP_INTERVAL == 0:
+            self._sweep(now_ns)
+
+        # Prepare rate limit information; the window resets once the bucket is full
         rate_info = {
             "limit": limit,
-            "remaining": remaining,
-            "reset_time": reset_time,
+            "remaining": max(0, int(limit - spent)),
+            "reset_time": self._to_wall_seconds(full_at_ns),
             "window_seconds": window_seconds,
         }
 
-        # Check if request is allowed
-        if current_count >= limit:
-            # Calculate retry after time
-            if self._requests[key]:
-                oldest_request = min(self._requests[key])
-                retry_after = int((oldest_request + window_seconds) - current_time)
-                rate_info["retry_after"] = max(1, retry_after)
-            else:
-                rate_info["retry_after"] = window_seconds
+        if not is_allowed:
+            rate_info["retry_after"] = max(1, math.ceil(wait_ns / NS_PER_SECOND))
 
-            return False, rate_info
+        return is_allowed, rate_info
 
-        # Request is allowed, record it
-        self._requests[key].append(current_time)
-        rate_info["remaining"] = remaining - 1
+    def sweep(self) -> int:
+        """
+        Drop buckets that have refilled completely since their last request.
 
-        return True, rate_info
+        Returns:
+            Number of buckets removed
+        """
+        return self._sweep(self._clock())
+
+    def _sweep(self, now_ns: int) -> int:
+        """Remove buckets that are full again at ``now_ns`` from every shard."""
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                idle = [
+                    k for k, (_, _, full_at_ns) in shard.buckets.items() if full_at_ns <= now_ns
+                ]
+                for key in idle:
+                    del shard.buckets[key]
+                expired = [k for k, (until_ns, _) in shard.blocked.items() if until_ns <= now_ns]
+                for blocked_key in expired:
+                    del shard.blocked[blocked_key]
+            removed += len(idle)
+        return removed
+
+    def _shard(self, key: str) -> _Shard:
+        """Return the shard that owns ``key``."""
+        return self._shards[hash(key) & (self.SHARD_COUNT - 1)]
+
+    def _to_wall_seconds(self, monotonic_ns: int) -> int:
+        """Convert a monotonic timestamp to whole Unix seconds."""
+        return (monotonic_ns + self._wall_offset_ns) // NS_PER_SECOND
 
     def clear_key(self, key: str) -> None:
         """
-        Clear all requests for a specific key.
+        Clear the bucket for a specific key.
 
         Args:
             key: The key to clear
         """
-        if key in self._requests:
-            del self._requests[key]
+        shard = self._shard(key)
+        with shard.lock:
+            shard.buckets.pop(key, None)
+            for blocked_key in [k for k in shard.blocked if k[0] == key]:
+                del shard.blocked[blocked_key]
 
     def clear_all(self) -> None:
-        """Clear all stored requests."""
-        self._requests.clear()
+        """Clear all stored buckets."""
+        for shard in self._shards:
+            with shard.lock:
+                shard.buckets.clear()
+                shard.blocked.clear()
 
     def get_stats(self, key: str) -> dict:
         """
@@ -100,12 +201,18 @@ class RateLimiter:
             key: The key to get stats for
 
         Returns:
-            Dictionary with current request count and timestamps
+            Dictionary with the number of tokens currently spent. Individual
+            request timestamps are no longer tracked, so ``request_timestamps``
+            is always empty and kept only for backwards compatibility.
         """
+        shard = self._shard(key)
+        with shard.lock:
+            bucket = shard.buckets.get(key)
+
         return {
             "key": key,
-            "current_requests": len(self._requests[key]),
-            "request_timestamps": self._requests[key].copy(),
+            "current_requests": math.ceil(bucket[0]) if bucket else 0,
+            "request_timestamps": [],
         }
 
 
@@ -5,8 +5,10 @@ import logging
 import time
 import uuid
 from datetime import UTC, datetime
+from functools import lru_cache
 
 from apscheduler.schedulers.background import BackgroundScheduler
+from apscheduler.schedulers.base import BaseScheduler
 from apscheduler.triggers.cron import CronTrigger
 from sqlalchemy.orm import Session
 
@@ -23,18 +25,67 @@ logger = logging.getLogger(__name__)
 structured_logger = StructuredLogger("SchedulerService")
 
 
+def _parse_time_of_day(time_str: str) -> tuple[int, int]:
+    """
+    Parse and validate an HH:MM time string.
+
+    Args:
+        time_str: Time string to parse
+
+    Returns:
+        Tuple of (hour, minute)
+
+    Raises:
+        ValueError: If format is invalid
+    """
+    # Checked before the cache lookup, which would raise TypeError on unhashable input
+    if not isinstance(time_str, str):
+        raise ValueError(f"Invalid time format: expected a string, got {type(time_str).__name__}")
+    parsed = _parse_time_of_day_cached(time_str)
+    if isinstance(parsed, str):
+        raise ValueError(parsed)
+    return parsed
+
+
+@lru_cache(maxsize=1024)
+def _parse_time_of_day_cached(time_str: str) -> tuple[int, int] | str:
+    """
+    Parse an HH:MM time string, returning the error message if it is invalid.
+
+    Failures are returned rather than raised so that they are cached too;
+    schedules reuse a handful of times, valid or not.
+    """
+    parts = time_str.split(":")
+    if len(parts) != 2:
+        return f"Invalid time format: {time_str}. Use HH:MM"
+    try:
+        hour, minute = int(parts[0]), int(parts[1])
+    except ValueError:
+        return f"Invalid time format: {time_str}. Use HH:MM"
+    if not (0 <= hour < 24 and 0 <= minute < 60):
+        return f"Invalid time values: {time_str}"
+    return hour, minute
+
+
 class SchedulerService:
     """Manages scheduled email deliveries at configured times."""
 
-    def __init__(self, db_session: Session | None = None, event_store: EventStore | None = None):
+    def __init__(
+        self,
+        db_session: Session | None = None,
+        event_store: EventStore | None = None,
+        scheduler: BaseScheduler | None = None,
+    ):
         """
         Initialize scheduler service.
 
         Args:
             db_session: SQLAlchemy database session
             event_store: EventStore instance for tracking operations
+            scheduler: APScheduler instance to register jobs on; defaults to a
+                BackgroundScheduler
         """
-        self.scheduler = BackgroundScheduler()
+        self.scheduler = scheduler or BackgroundScheduler()
         self.db_session = db_session
         self.event_store = event_store
         self.email_service = EmailService(db_session, event_store)
@@ -53,13 +104,9 @@ class SchedulerService:
         Raises:
             ValueError: If time format is invalid
         """
-        # Validate time format
-        self._validate_time_format(morning_time)
-        self._validate_time_format(evening_time)
-
-        # Parse times
-        morning_hour, morning_minute = map(int, morning_time.split(":"))
-        evening_hour, evening_minute = map(int, evening_time.split(":"))
+        # Validate and parse times
+        morning_hour, morning_minute = _parse_time_of_day(morning_time)
+        evening_hour, evening_minute = _parse_time_of_day(evening_time)
 
         # Schedule morning delivery
         self.scheduler.add_job(
@@ -511,12 +558,4 @@ class SchedulerService:
         Raises:
             ValueError: If format is invalid
         """
-        try:
-            parts = time_str.split(":")
-            if len(parts) != 2:
-                raise ValueError(f"Invalid time format: {time_str}. Use HH:MM")
-            hour, minute = int(parts[0]), int(parts[1])
-            if not (0 <= hour < 24 and 0 <= minute < 60):
-                raise ValueError(f"Invalid time values: {time_str}")
-        except (ValueError, AttributeError) as e:
-            raise ValueError(f"Invalid time format: {e}") from e
+        _parse_time_of_day(time_str)
@@ -1,5 +1,8 @@
 """JWT token generation and validation service."""
 
+import threading
+import time
+from collections import OrderedDict
 from datetime import UTC, datetime, timedelta
 from typing import Any
 
@@ -7,6 +10,15 @@ import jwt
 
 from src.utils.config import config
 
+# Signing key and accepted algorithms, built once instead of on every call
+_SECRET_KEY = config.jwt.secret_key.encode("utf-8")
+_ALGORITHMS = [config.jwt.algorithm]
+
+# Verified token payloads keyed by raw token, reused until the token's "exp"
+VERIFIED_TOKEN_CACHE_SIZE = 1024
+_verified_tokens: OrderedDict[str, dict[str, Any]] = OrderedDict()
+_verified_tokens_lock = threading.Lock()
+
 
 class TokenService:
     """Service for JWT token generation and validation."""
@@ -45,7 +57,7 @@ class TokenService:
 
         token = jwt.encode(
             payload,
-            config.jwt.secret_key,
+            _SECRET_KEY,
             algorithm=config.jwt.algorithm,
         )
 
@@ -85,7 +97,7 @@ class TokenService:
 
         token = jwt.encode(
             payload,
-            config.jwt.secret_key,
+            _SECRET_KEY,
             algorithm=config.jwt.algorithm,
         )
 
@@ -96,6 +108,10 @@ class TokenService:
         """
         Verify and decode a JWT token.
 
+        A successful verification is cached, and the payload is reused for the
+        same token until its expiry; failures are never cached, so invalid
+        tokens are re-checked every time.
+
         Args:
             token: The JWT token to verify
 
@@ -110,18 +126,41 @@ class TokenService:
         if not token:
             raise ValueError("Token cannot be empty")
 
+        with _verified_tokens_lock:
+            payload = _verified_tokens.get(token)
+            if payload is not None:
+                if payload["exp"] > time.time():
+                    _verified_tokens.move_to_end(token)
+                    # Hand out a copy so callers cannot alter the cached payload
+                    return dict(payload)
+                del _verified_tokens[token]
+
         try:
             payload = jwt.decode(
                 token,
-                config.jwt.secret_key,
-                algorithms=[config.jwt.algorithm],
+                _SECRET_KEY,
+                algorithms=_ALGORITHMS,
             )
-            return payload
         except jwt.ExpiredSignatureError as e:
             raise jwt.ExpiredSignatureError("Token has expired") from e
         except jwt.InvalidTokenError as e:
             raise jwt.InvalidTokenError(f"Invalid token: {e!s}") from e
 
+        # Tokens without an expiry are verified every time
+        if "exp" in payload:
+            with _verified_tokens_lock:
+                _verified_tokens[token] = dict(payload)
+                if len(_verified_tokens) > VERIFIED_TOKEN_CACHE_SIZE:
+                    _verified_tokens.popitem(last=False)
+
+        return payload
+
+    @staticmethod
+    def clear_verify_cache() -> None:
+        """Forget all cached token verifications."""
+        with _verified_tokens_lock:
+            _verified_tokens.clear()
+
     @staticmethod
     def decode_token(token: str) -> dict[str, Any]:
         """
@@ -1,19 +1,24 @@
 """In-memory event store for tracking system operations and logs."""
 
+import math
 import threading
+import time
 import uuid
 from collections import deque
+from collections.abc import Iterable, Mapping
 from dataclasses import asdict, dataclass
-from datetime import UTC, datetime, timedelta
+from datetime import UTC, datetime
+from itertools import islice
+from types import MappingProxyType
 from typing import Any
 
 
-@dataclass
+@dataclass(slots=True)
 class Event:
     """Represents a system event."""
 
     id: str
-    timestamp: str
+    timestamp_ns: int
     trace_id: str
     event_type: str
     component: str
@@ -21,13 +26,39 @@ class Event:
     context: dict[str, Any]
     duration_ms: float | None = None
 
+    def __post_init__(self) -> None:
+        """Reject durations that would poison the running duration totals."""
+        if self.duration_ms is not None and not math.isfinite(self.duration_ms):
+            raise ValueError(f"duration_ms must be finite, got {self.duration_ms}")
+
+    @property
+    def timestamp(self) -> str:
+        """ISO8601 UTC timestamp, derived from timestamp_ns on access."""
+        dt = datetime.fromtimestamp(self.timestamp_ns / 1e9, UTC)
+        return dt.isoformat(timespec="microseconds").replace("+00:00", "Z")
+
     def to_dict(self) -> dict[str, Any]:
         """Convert event to dictionary, excluding None values."""
         result = asdict(self)
+        # Expose the ISO timestamp rather than the raw nanosecond value
+        result["timestamp"] = self.timestamp
+        del result["timestamp_ns"]
         # Remove None values
         return {k: v for k, v in result.items() if v is not None}
 
 
+@dataclass(frozen=True, slots=True)
+class EventStoreSnapshot:
+    """Immutable point-in-time view of an event store."""
+
+    events: tuple[Event, ...]
+    duration_totals: Mapping[str, tuple[float, int]]
+
+    def get_duration_totals(self, event_type: str) -> tuple[float, int]:
+        """Get the (sum, count) of durations for an event type at snapshot time."""
+        return self.duration_totals.get(event_type, (0.0, 0))
+
+
 class EventStore:
     """In-memory event store with configurable size limit and automatic purging."""
 
@@ -41,8 +72,53 @@ class EventStore:
         """
         self.max_size = max_size
         self.max_age_seconds = max_age_seconds
-        self._events: deque = deque(maxlen=max_size)
+        self._events: deque[Event] = deque(maxlen=max_size)
         self._lock = threading.RLock()
+        # Running (sum, compensation, count) of durations per event type for stored
+        # events; the Neumaier compensation keeps what evicting an outlier would
+        # otherwise lose to rounding
+        self._duration_totals: dict[str, tuple[float, float, int]] = {}
+
+    def _track_duration(self, event: Event, sign: int) -> None:
+        """Add (sign=1) or remove (sign=-1) an event from the running duration totals."""
+        if event.duration_ms is None:
+            return
+        total, compensation, count = self._duration_totals.get(event.event_type, (0.0, 0.0, 0))
+        count += sign
+        if count == 0:
+            # Nothing left to sum, so drop any leftover rounding error as well
+            self._duration_totals[event.event_type] = (0.0, 0.0, 0)
+            return
+        value = sign * event.duration_ms
+        new_total = total + value
+        if abs(total) >= abs(value):
+            compensation += (total - new_total) + value
+        else:
+            compensation += (value - new_total) + total
+        self._duration_totals[event.event_type] = (new_total, compensation, count)
+
+    def _duration_totals_as_pairs(self) -> dict[str, tuple[float, int]]:
+        """Collapse the running totals to compensated (sum, count) pairs."""
+        return {
+            event_type: (total + compensation, count)
+            for event_type, (total, compensation, count) in self._duration_totals.items()
+        }
+
+    def _extend(self, created: list[Event]) -> None:
+        """Append already-built events, keeping the duration totals in sync."""
+        with self._lock:
+            evicted = max(0, len(self._events) + len(created) - self.max_size)
+            for event in islice(self._events, evicted):
+                self._track_duration(event, -1)
+            for event in created[max(0, evicted - len(self._events)) :]:
+                self._track_duration(event, 1)
+            self._events.extend(created)
+
+    def _rebuild_duration_totals(self) -> None:
+        """Recompute the running duration totals from the stored events."""
+        self._duration_totals = {}
+        for event in self._events:
+            self._track_duration(event, 1)
 
     def add_event(
         self,
@@ -70,7 +146,7 @@ class EventStore:
         with self._lock:
             event = Event(
                 id=str(uuid.uuid4()),
-                timestamp=datetime.now(UTC).isoformat().replace("+00:00", "Z"),
+                timestamp_ns=time.time_ns(),
                 trace_id=trace_id,
                 event_type=event_type,
                 component=component,
@@ -78,9 +154,111 @@ class EventStore:
                 context=context or {},
                 duration_ms=duration_ms,
             )
+            if self._events and len(self._events) == self.max_size:
+                # The deque is full, so the append below evicts the oldest event
+                self._track_duration(self._events[0], -1)
             self._events.append(event)
+            # A zero-length deque discards the event straight away
+            if self.max_size != 0:
+                self._track_duration(event, 1)
             return event
 
+    def add_events(self, events: Iterable[dict[str, Any]]) -> list[Event]:
+        """
+        Add several events to the store in one operation.
+
+        The lock is taken once and the underlying deque is extended in a single
+        call, which is cheaper than repeated add_event calls for bulk inserts.
+
+        Args:
+            events: Mappings of add_event keyword arguments (trace_id, event_type,
+                component, message and optionally context and duration_ms)
+
+        Returns:
+            The created Event objects in insertion order
+        """
+        timestamp_ns = time.time_ns()
+        created = [
+            Event(
+                id=str(uuid.uuid4()),
+                timestamp_ns=timestamp_ns,
+                trace_id=fields["trace_id"],
+                event_type=fields["event_type"],
+                component=fields["component"],
+                message=fields["message"],
+                context=fields.get("context") or {},
+                duration_ms=fields.get("duration_ms"),
+            )
+            for fields in events
+        ]
+        self._extend(created)
+        return created
+
+    def add_trace(
+        self,
+        trace_id: str,
+        events: Iterable[tuple[str, str, str, dict[str, Any] | None, float | None]],
+    ) -> list[Event]:
+        """
+        Add a sequence of events that all belong to the same trace.
+
+        Args:
+            trace_id: Trace ID shared by every event
+            events: Tuples of (event_type, component, message, context, duration_ms)
+
+        Returns:
+            The created Event objects in insertion order
+        """
+        timestamp_ns = time.time_ns()
+        created = [
+            Event(
+                id=str(uuid.uuid4()),
+                timestamp_ns=timestamp_ns,
+                trace_id=trace_id,
+                event_type=event_type,
+                component=component,
+                message=message,
+                context=context or {},
+                duration_ms=duration_ms,
+            )
+            for event_type, component, message, context, duration_ms in events
+        ]
+        self._extend(created)
+        return created
+
+    def get_duration_totals(self, event_type: str) -> tuple[float, int]:
+        """
+        Get the running duration totals for an event type.
+
+        The totals are maintained incrementally as events are added and evicted,
+        so averages can be derived without rescanning the store.
+
+        Args:
+            event_type: The event type to look up
+
+        Returns:
+            Tuple of (sum of duration_ms, number of events with a duration)
+        """
+        with self._lock:
+            total, compensation, count = self._duration_totals.get(event_type, (0.0, 0.0, 0))
+        return total + compensation, count
+
+    def snapshot(self) -> EventStoreSnapshot:
+        """
+        Take a consistent, read-only view of the store.
+
+        The lock is held only while the events and duration totals are copied, so
+        readers can aggregate over the snapshot without blocking writers.
+
+        Returns:
+            EventStoreSnapshot with the stored events and running duration totals
+        """
+        with self._lock:
+            return EventStoreSnapshot(
+                events=tuple(self._events),
+                duration_totals=MappingProxyType(self._duration_totals_as_pairs()),
+            )
+
     def get_recent_events(self, limit: int = 100) -> list[Event]:
         """
         Get the most recent events.
@@ -135,26 +313,26 @@ class EventStore:
             Number of events removed
         """
         max_age = max_age_seconds or self.max_age_seconds
-        cutoff_time = datetime.now(UTC) - timedelta(seconds=max_age)
+        cutoff_ns = time.time_ns() - max_age * 1_000_000_000
 
         with self._lock:
             initial_count = len(self._events)
 
             # Create a new deque with only recent events
-            new_events = deque(maxlen=self.max_size)
+            new_events: deque[Event] = deque(maxlen=self.max_size)
             for event in self._events:
-                # Parse the ISO8601 timestamp
-                event_time = datetime.fromisoformat(event.timestamp.replace("Z", "+00:00"))
-                if event_time > cutoff_time:
+                if event.timestamp_ns > cutoff_ns:
                     new_events.append(event)
 
             self._events = new_events
+            self._rebuild_duration_totals()
             return initial_count - len(self._events)
 
     def clear(self) -> None:
         """Clear all events from the store."""
         with self._lock:
             self._events.clear()
+            self._duration_totals = {}
 
     def size(self) -> int:
         """Get the current number of events in the store."""
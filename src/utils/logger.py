@@ -42,6 +42,27 @@ class StructuredLogger:
         Returns:
             JSON-formatted log entry
         """
+        return json.dumps(self._build_log_entry(level, message, context, exception))
+
+    def _build_log_entry(
+        self,
+        level: str,
+        message: str,
+        context: dict[str, Any] | None = None,
+        exception: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """
+        Build the fields of a log entry before serialization.
+
+        Args:
+            level: Log level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+            message: Log message
+            context: Optional context fields
+            exception: Optional exception details
+
+        Returns:
+            Log entry as a dictionary
+        """
         entry = {
             "timestamp": datetime.now(UTC).isoformat().replace("+00:00", "Z"),
             "level": level,
@@ -55,7 +76,7 @@ class StructuredLogger:
         if exception:
             entry["exception"] = exception
 
-        return json.dumps(entry)
+        return entry
 
     def _write_log(self, log_entry: str) -> None:
         """
@@ -1,5 +1,6 @@
 """Metrics calculator for aggregating event store data."""
 
+import time
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from typing import Any
@@ -56,7 +57,13 @@ class MetricsCalculator:
             start_time: Optional start time for uptime calculation (defaults to now)
         """
         self.event_store = event_store
-        self.start_time = start_time or datetime.now(UTC)
+        # Uptime is computed from integer nanoseconds to keep calculate() off datetime
+        if start_time is None:
+            self._start_ns = time.time_ns()
+            start_time = datetime.fromtimestamp(self._start_ns / 1_000_000_000, UTC)
+        else:
+            self._start_ns = int(start_time.timestamp() * 1_000_000_000)
+        self.start_time = start_time
 
     def calculate(self) -> Metrics:
         """
@@ -65,57 +72,56 @@ class MetricsCalculator:
         Returns:
             Metrics object with aggregated statistics
         """
-        events = self.event_store.get_all_events()
-
-        # Calculate delivery metrics
-        delivery_completes = [e for e in events if e.event_type == "delivery_complete"]
-
-        total_deliveries = len(delivery_completes)
-        successful_deliveries = len(
-            [e for e in delivery_completes if e.context.get("status") == "success"]
-        )
-        failed_deliveries = len(
-            [e for e in delivery_completes if e.context.get("status") == "failed"]
-        )
+        # Read events and duration totals from one consistent snapshot
+        snapshot = self.event_store.snapshot()
+
+        # Aggregate every counter in a single pass over the events
+        successful_deliveries = failed_deliveries = total_deliveries = 0
+        successful_fetches = failed_fetches = total_fetch_attempts = 0
+        total_tips_generated = total_emails_sent = 0
+        recent_errors_count = 0
+
+        for e in snapshot.events:
+            event_type = e.event_type
+            if event_type == "delivery_complete":
+                total_deliveries += 1
+                context = e.context
+                status = context.get("status")
+                if status == "success":
+                    successful_deliveries += 1
+                elif status == "failed":
+                    failed_deliveries += 1
+                total_tips_generated += context.get("tips_generated", 0)
+                total_emails_sent += context.get("recipients_sent", 0)
+            elif event_type == "fetch_complete":
+                total_fetch_attempts += 1
+                status = e.context.get("status")
+                if status == "success":
+                    successful_fetches += 1
+                elif status == "failed":
+                    failed_fetches += 1
+            elif event_type == "error":
+                recent_errors_count += 1
 
         # Calculate success rate
         success_rate = (
             (successful_deliveries / total_deliveries * 100) if total_deliveries > 0 else 0.0
         )
 
-        # Calculate average delivery duration
-        delivery_durations = [
-            e.duration_ms for e in delivery_completes if e.duration_ms is not None
-        ]
-        average_delivery_duration_ms = (
-            sum(delivery_durations) / len(delivery_durations) if delivery_durations else 0.0
+        # Average durations come from the store's running totals
+        delivery_duration_sum, delivery_duration_count = snapshot.get_duration_totals(
+            "delivery_complete"
         )
-
-        # Calculate tips and emails
-        total_tips_generated = sum(e.context.get("tips_generated", 0) for e in delivery_completes)
-        total_emails_sent = sum(e.context.get("recipients_sent", 0) for e in delivery_completes)
-
-        # Calculate fetch metrics
-        fetch_completes = [e for e in events if e.event_type == "fetch_complete"]
-        total_fetch_attempts = len(fetch_completes)
-        successful_fetches = len(
-            [e for e in fetch_completes if e.context.get("status") == "success"]
+        fetch_duration_sum, fetch_duration_count = snapshot.get_duration_totals("fetch_complete")
+        average_delivery_duration_ms = (
+            delivery_duration_sum / delivery_duration_count if delivery_duration_count else 0.0
         )
-        failed_fetches = len([e for e in fetch_completes if e.context.get("status") == "failed"])
-
-        # Calculate average fetch duration
-        fetch_durations = [e.duration_ms for e in fetch_completes if e.duration_ms is not None]
         average_fetch_duration_ms = (
-            sum(fetch_durations) / len(fetch_durations) if fetch_durations else 0.0
+            fetch_duration_sum / fetch_duration_count if fetch_duration_count else 0.0
         )
 
-        # Calculate error metrics
-        error_events = [e for e in events if e.event_type == "error"]
-        recent_errors_count = len(error_events)
-
         # Calculate uptime
-        current_time = datetime.now(UTC)
-        uptime_seconds = int((current_time - self.start_time).total_seconds())
+        uptime_seconds = int((time.time_ns() - self._start_ns) / 1_000_000_000)
 
         return Metrics(
             total_deliveries=total_deliveries,
@@ -1,71 +1,135 @@
 """Pytest configuration and fixtures."""
 
+import asyncio
 import os
-import tempfile
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import patch
 
+import httpx
 import pytest
+from hypothesis import settings
 from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
 
 from main import app
 from src.database.db import get_db
 from src.database.models import Base
 
+# Hypothesis profiles: "dev" for local runs, "ci" for a quick pipeline pass and
+# "full" (Hypothesis' default of 100 examples) for the nightly workflow.
+# Tests that pin max_examples themselves keep their own value.
+settings.register_profile("dev", max_examples=20)
+settings.register_profile("ci", max_examples=5, deadline=None)
+settings.register_profile("full", max_examples=100, deadline=None)
+settings.load_profile(os.getenv("HYPOTHESIS_PROFILE", "dev"))
 
-@pytest.fixture()
-def test_db():
-    """Create a file-based test database."""
-    # Create a temporary file for the database
-    fd, db_path = tempfile.mkstemp(suffix=".db")
-    os.close(fd)
 
-    engine = create_engine(f"sqlite:///{db_path}", connect_args={"check_same_thread": False})
+@pytest.fixture(scope="session")
+def event_loop():
+    """Share one event loop across the session instead of creating one per async test."""
+    loop = asyncio.new_event_loop()
+    yield loop
+    loop.close()
+
 
-    # Enable foreign keys
+@pytest.fixture(scope="session")
+def test_db():
+    """Create an in-memory test database, building the schema once per session."""
+    # StaticPool hands out one connection, which is all a private in-memory
+    # database needs; each pytest-xdist worker process gets its own database
+    engine = create_engine(
+        "sqlite+pysqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+
+    # Enable foreign keys and let SQLAlchemy emit BEGIN itself, which pysqlite
+    # otherwise defers and which SAVEPOINT-based test isolation depends on
     @event.listens_for(engine, "connect")
     def set_sqlite_pragma(dbapi_conn, connection_record):
+        dbapi_conn.isolation_level = None
         cursor = dbapi_conn.cursor()
         cursor.execute("PRAGMA foreign_keys=ON")
         cursor.close()
 
+    @event.listens_for(engine, "begin")
+    def do_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     Base.metadata.create_all(bind=engine)
 
     yield engine
 
-    # Cleanup
     engine.dispose()
-    try:
-        os.unlink(db_path)
-    except:  # noqa: E722
-        pass
 
 
 @pytest.fixture()
 def test_session(test_db):
-    """Create a test database session."""
-    testing_session_local = sessionmaker(autocommit=False, autoflush=False, bind=test_db)
+    """
+    Create a test database session whose changes are discarded after the test.
+
+    The session joins an outer transaction; commits made by application code
+    only release SAVEPOINTs, so rolling the outer transaction back leaves the
+    shared schema empty for the next test.
+    """
+    connection = test_db.connect()
+    transaction = connection.begin()
+    testing_session_local = sessionmaker(
+        autocommit=False,
+        autoflush=False,
+        bind=connection,
+        join_transaction_mode="create_savepoint",
+    )
     session = testing_session_local()
 
     yield session
 
-    session.rollback()
     session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest.fixture(scope="session")
+def shared_test_client():
+    """Create one TestClient for the whole session; per-test state lives in overrides."""
+    from fastapi.testclient import TestClient
+
+    return TestClient(app)
 
 
 @pytest.fixture()
-def test_client(test_session):
-    """Create a test client with test database."""
+def test_client(shared_test_client, test_session):
+    """Bind the shared test client to this test's database session."""
 
     def override_get_db():
         yield test_session
 
     app.dependency_overrides[get_db] = override_get_db
 
-    from fastapi.testclient import TestClient
+    yield shared_test_client
+
+    app.dependency_overrides.clear()
+    shared_test_client.cookies.clear()
 
-    client = TestClient(app)
-    yield client
+
+@pytest.fixture()
+async def async_client(test_session):
+    """
+    Create an async HTTP client that calls the app in-process over ASGI.
+
+    Every request is served with this test's single database session, so
+    requests that reach the database must be awaited one at a time.
+    """
+
+    def override_get_db():
+        yield test_session
+
+    app.dependency_overrides[get_db] = override_get_db
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://testserver") as client:
+        yield client
 
     app.dependency_overrides.clear()
 
@@ -74,10 +138,7 @@ def test_client(test_session):
 def mock_mailgun_requests():
     """Auto-mock all Mailgun API requests in tests."""
     with patch("src.services.email_service.requests.post") as mock_post:
-        mock_response = MagicMock()
-        mock_response.status_code = 200
-        mock_response.text = "OK"
-        mock_post.return_value = mock_response
+        mock_post.return_value = SimpleNamespace(status_code=200, text="OK")
         yield mock_post
 
 
@@ -89,3 +150,36 @@ def clear_rate_limiter():
     rate_limiter.clear_all()
     yield
     rate_limiter.clear_all()
+
+
+@pytest.fixture()
+def oauth_config():
+    """A lightweight OAuth config stub to pass to OAuthService via ``cfg``."""
+    return SimpleNamespace(
+        oauth=SimpleNamespace(
+            google_client_id="test_client_id",
+            google_client_secret="test_client_secret",
+            google_redirect_uri="http://localhost:8000/auth/google/callback",
+            github_client_id="test_github_client_id",
+            github_client_secret="test_github_client_secret",
+            github_redirect_uri="http://localhost:8000/auth/github/callback",
+        )
+    )
+
+
+@pytest.fixture(autouse=True, scope="session")
+def fast_bcrypt():
+    """Use the minimum bcrypt work factor in tests; the cost itself isn't under test."""
+    from src.services.password_service import PasswordService
+
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(PasswordService, "BCRYPT_ROUNDS", 4)
+        yield
+
+
+@pytest.fixture(scope="session")
+def bcrypt_hash():
+    """A bcrypt hash of "SecurePassword123!", computed once per test session."""
+    from src.services.password_service import PasswordService
+
+    return PasswordService.hash_password("SecurePassword123!")
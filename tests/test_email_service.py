@@ -1,7 +1,8 @@
 """Tests for email service."""
 
 from datetime import UTC, datetime
-from unittest.mock import MagicMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import Mock, patch
 
 import pytest
 from hypothesis import given, settings
@@ -70,13 +71,9 @@ class TestEmailService:
 
             def post_side_effect(*args, **kwargs):
                 call_count[0] += 1
-                mock_response = MagicMock()
                 if call_count[0] < failure_attempt:
-                    mock_response.status_code = 500
-                    mock_response.text = "Server error"
-                else:
-                    mock_response.status_code = 200
-                return mock_response
+                    return SimpleNamespace(status_code=500, text="Server error")
+                return SimpleNamespace(status_code=200, text="OK")
 
             mock_post.side_effect = post_side_effect
 
@@ -115,7 +112,7 @@ class TestEmailService:
         service = EmailService(db_session=None)
 
         # Always fail
-        mock_mailgun_requests.return_value = MagicMock(status_code=500, text="Server error")
+        mock_mailgun_requests.return_value = SimpleNamespace(status_code=500, text="Server error")
 
         with patch("time.sleep"):
             result = service.send_email(
@@ -2,6 +2,7 @@
 
 import uuid
 
+import pytest
 from hypothesis import given
 from hypothesis import strategies as st
 
@@ -266,3 +267,154 @@ class TestEventStoreOrdering:
                     other_events = store.get_events_by_trace(other_trace)
                     for event in other_events:
                         assert event.trace_id != trace_id
+
+    @given(
+        num_events=st.integers(min_value=0, max_value=30),
+    )
+    def test_add_events_matches_individual_inserts(self, num_events):
+        """
+        For any batch of events, add_events SHALL store them in order exactly as
+        the equivalent sequence of add_event calls would.
+        """
+        store = EventStore(max_size=20)
+        trace_id = str(uuid.uuid4())
+
+        created = store.add_events(
+            {
+                "trace_id": trace_id,
+                "event_type": "test_event",
+                "component": "test_component",
+                "message": f"Event {i}",
+                "context": {"index": i},
+            }
+            for i in range(num_events)
+        )
+
+        assert len(created) == num_events
+        stored = store.get_all_events()
+        assert len(stored) == min(num_events, 20)
+        assert [e.id for e in stored] == [e.id for e in created[-20:]]
+        assert [e.context["index"] for e in stored] == list(range(num_events))[-20:]
+
+    @given(
+        durations=st.lists(
+            st.one_of(st.none(), st.floats(min_value=0, max_value=10_000)), max_size=30
+        ),
+        use_bulk=st.booleans(),
+    )
+    def test_duration_totals_track_stored_events(self, durations, use_bulk):
+        """
+        For any sequence of events, including ones evicted by max_size, the running
+        duration totals SHALL match the durations of the events still stored.
+        """
+        store = EventStore(max_size=10)
+        trace_id = str(uuid.uuid4())
+        fields = [
+            {
+                "trace_id": trace_id,
+                "event_type": "delivery_complete",
+                "component": "scheduler",
+                "message": f"Event {i}",
+                "duration_ms": duration,
+            }
+            for i, duration in enumerate(durations)
+        ]
+
+        if use_bulk:
+            store.add_events(fields)
+        else:
+            for kwargs in fields:
+                store.add_event(**kwargs)
+
+        stored = [e.duration_ms for e in store.get_all_events() if e.duration_ms is not None]
+        total, count = store.get_duration_totals("delivery_complete")
+        assert count == len(stored)
+        assert abs(total - sum(stored)) < 1e-6
+
+        store.clear()
+        assert store.get_duration_totals("delivery_complete") == (0.0, 0)
+
+    @given(
+        num_before=st.integers(min_value=0, max_value=20),
+        num_after=st.integers(min_value=1, max_value=20),
+    )
+    def test_snapshot_is_isolated_from_later_writes(self, num_before, num_after):
+        """
+        For any snapshot, events added afterwards SHALL not appear in it and its
+        duration totals SHALL reflect only the events captured.
+        """
+        store = EventStore()
+        trace_id = str(uuid.uuid4())
+        for i in range(num_before):
+            store.add_event(
+                trace_id=trace_id,
+                event_type="fetch_complete",
+                component="test_component",
+                message=f"Event {i}",
+                duration_ms=10.0,
+            )
+
+        snapshot = store.snapshot()
+
+        for i in range(num_after):
+            store.add_event(
+                trace_id=trace_id,
+                event_type="fetch_complete",
+                component="test_component",
+                message=f"Later event {i}",
+                duration_ms=10.0,
+            )
+
+        assert len(snapshot.events) == num_before
+        assert snapshot.get_duration_totals("fetch_complete") == (10.0 * num_before, num_before)
+        assert store.size() == num_before + num_after
+
+    def test_evicting_an_outlier_leaves_exact_duration_totals(self):
+        """Evicting a huge duration SHALL not leave rounding error in the totals."""
+        store = EventStore(max_size=3)
+        trace_id = str(uuid.uuid4())
+        for duration in [1e17, 1.5, 2.5, 3.5]:
+            store.add_event(
+                trace_id=trace_id,
+                event_type="delivery_complete",
+                component="scheduler",
+                message="Delivery complete",
+                duration_ms=duration,
+            )
+
+        assert store.get_duration_totals("delivery_complete") == (7.5, 3)
+        assert store.snapshot().get_duration_totals("delivery_complete") == (7.5, 3)
+
+    def test_zero_size_store_keeps_nothing(self):
+        """A store with max_size=0 SHALL accept events without storing or counting them."""
+        store = EventStore(max_size=0)
+        fields = {
+            "trace_id": str(uuid.uuid4()),
+            "event_type": "delivery_complete",
+            "component": "scheduler",
+            "message": "Delivery complete",
+            "duration_ms": 5.0,
+        }
+
+        store.add_event(**fields)
+        store.add_events([fields])
+
+        assert store.size() == 0
+        assert store.get_duration_totals("delivery_complete") == (0.0, 0)
+
+    @pytest.mark.parametrize("duration", [float("inf"), float("-inf"), float("nan")])
+    def test_non_finite_duration_is_rejected(self, duration):
+        """A non-finite duration SHALL be rejected instead of skewing the totals."""
+        store = EventStore()
+
+        with pytest.raises(ValueError, match="must be finite"):
+            store.add_event(
+                trace_id=str(uuid.uuid4()),
+                event_type="delivery_complete",
+                component="scheduler",
+                message="Delivery complete",
+                duration_ms=duration,
+            )
+
+        assert store.size() == 0
+        assert store.get_duration_totals("delivery_complete") == (0.0, 0)
@@ -2,7 +2,7 @@
 
 import json
 from datetime import UTC, datetime, timedelta
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 from fastapi import status
 from fastapi.testclient import TestClient
@@ -76,15 +76,23 @@ class TestSchedulerToEmailFlow:
         )
 
         with patch.object(
-            scheduler.market_aggregator, "fetch_crypto_data", return_value=[mock_market_data]
+            scheduler.market_aggregator,
+            "fetch_crypto_data",
+            new=Mock(return_value=[mock_market_data]),
         ):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
+            with patch.object(
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[])
+            ):
                 with patch.object(
-                    scheduler.analysis_engine, "analyze_crypto", return_value=[mock_tip]
+                    scheduler.analysis_engine, "analyze_crypto", new=Mock(return_value=[mock_tip])
                 ):
-                    with patch.object(scheduler.analysis_engine, "analyze_stocks", return_value=[]):
+                    with patch.object(
+                        scheduler.analysis_engine, "analyze_stocks", new=Mock(return_value=[])
+                    ):
                         with patch.object(
-                            scheduler.email_service, "send_email_content", return_value=True
+                            scheduler.email_service,
+                            "send_email_content",
+                            new=Mock(return_value=True),
                         ) as mock_send:
                             # Execute morning delivery
                             scheduler.execute_delivery("morning")
@@ -159,19 +167,23 @@ class TestSchedulerToEmailFlow:
         )
 
         with patch.object(
-            scheduler.market_aggregator, "fetch_crypto_data", return_value=[crypto_data]
+            scheduler.market_aggregator, "fetch_crypto_data", new=Mock(return_value=[crypto_data])
         ):
             with patch.object(
-                scheduler.market_aggregator, "fetch_stock_data", return_value=[stock_data]
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[stock_data])
             ):
                 with patch.object(
-                    scheduler.analysis_engine, "analyze_crypto", return_value=[crypto_tip]
+                    scheduler.analysis_engine, "analyze_crypto", new=Mock(return_value=[crypto_tip])
                 ):
                     with patch.object(
-                        scheduler.analysis_engine, "analyze_stocks", return_value=[stock_tip]
+                        scheduler.analysis_engine,
+                        "analyze_stocks",
+                        new=Mock(return_value=[stock_tip]),
                     ):
                         with patch.object(
-                            scheduler.email_service, "send_email_content", return_value=True
+                            scheduler.email_service,
+                            "send_email_content",
+                            new=Mock(return_value=True),
                         ) as mock_send:
                             # Execute evening delivery
                             scheduler.execute_delivery("evening")
@@ -229,16 +241,24 @@ class TestSchedulerToDashboardFlow:
         )
 
         with patch.object(
-            scheduler.market_aggregator, "fetch_crypto_data", return_value=[mock_market_data]
+            scheduler.market_aggregator,
+            "fetch_crypto_data",
+            new=Mock(return_value=[mock_market_data]),
         ):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
+            with patch.object(
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[])
+            ):
                 with patch.object(
-                    scheduler.analysis_engine, "analyze_crypto", return_value=[mock_tip]
+                    scheduler.analysis_engine, "analyze_crypto", new=Mock(return_value=[mock_tip])
                 ):
-                    with patch.object(scheduler.analysis_engine, "analyze_stocks", return_value=[]):
+                    with patch.object(
+                        scheduler.analysis_engine, "analyze_stocks", new=Mock(return_value=[])
+                    ):
                         # Mock email sending to avoid actual SMTP calls
                         with patch.object(
-                            scheduler.email_service, "send_email_content", return_value=True
+                            scheduler.email_service,
+                            "send_email_content",
+                            new=Mock(return_value=True),
                         ):
                             # Manually persist tip to database (simulating what would happen in real flow)
                             tip_record = TipRecord(
@@ -315,9 +335,11 @@ class TestErrorScenarios:
         with patch.object(
             scheduler.market_aggregator,
             "fetch_crypto_data",
-            side_effect=Exception("API connection failed"),
+            new=Mock(side_effect=Exception("API connection failed")),
         ):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
+            with patch.object(
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[])
+            ):
                 # Should not raise, just log error
                 scheduler.execute_delivery("morning")
 
@@ -355,16 +377,24 @@ class TestErrorScenarios:
         )
 
         with patch.object(
-            scheduler.market_aggregator, "fetch_crypto_data", return_value=[mock_market_data]
+            scheduler.market_aggregator,
+            "fetch_crypto_data",
+            new=Mock(return_value=[mock_market_data]),
         ):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
+            with patch.object(
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[])
+            ):
                 with patch.object(
-                    scheduler.analysis_engine, "analyze_crypto", return_value=[mock_tip]
+                    scheduler.analysis_engine, "analyze_crypto", new=Mock(return_value=[mock_tip])
                 ):
-                    with patch.object(scheduler.analysis_engine, "analyze_stocks", return_value=[]):
+                    with patch.object(
+                        scheduler.analysis_engine, "analyze_stocks", new=Mock(return_value=[])
+                    ):
                         # Mock email service to fail then succeed
                         with patch.object(
-                            scheduler.email_service, "send_email_content", return_value=False
+                            scheduler.email_service,
+                            "send_email_content",
+                            new=Mock(return_value=False),
                         ) as mock_send:
                             scheduler.execute_delivery("morning")
 
@@ -402,9 +432,15 @@ class TestErrorScenarios:
         scheduler = SchedulerService(db_session=test_session)
 
         # Mock empty market data
-        with patch.object(scheduler.market_aggregator, "fetch_crypto_data", return_value=[]):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
-                with patch.object(scheduler.email_service, "send_email_content") as mock_send:
+        with patch.object(
+            scheduler.market_aggregator, "fetch_crypto_data", new=Mock(return_value=[])
+        ):
+            with patch.object(
+                scheduler.market_aggregator, "fetch_stock_data", new=Mock(return_value=[])
+            ):
+                with patch.object(
+                    scheduler.email_service, "send_email_content", new=Mock()
+                ) as mock_send:
                     scheduler.execute_delivery("morning")
 
                     # Email should not be sent if no data available
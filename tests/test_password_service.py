@@ -1,17 +1,33 @@
 """Tests for password service with property-based testing."""
 
+from functools import lru_cache
+
 import pytest
-from hypothesis import HealthCheck, given, settings
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from src.services.password_service import PasswordService
 
+# Non-blank passwords: excluding control, surrogate and separator categories means
+# every generated string survives .strip(), so no examples are wasted on a guard
+_PASSWORD_STRATEGY = st.text(
+    alphabet=st.characters(blacklist_categories=("Cc", "Cs", "Zs", "Zl", "Zp")),
+    min_size=1,
+    max_size=50,
+)
+
+
+@lru_cache(maxsize=64)
+def _cached_hash(password: str) -> str:
+    """Hash a password once; Hypothesis shrinking replays many identical inputs."""
+    return PasswordService.hash_password(password)
+
 
 class TestPasswordServicePropertyBased:
     """Property-based tests for PasswordService."""
 
-    @settings(max_examples=10, deadline=None, suppress_health_check=[HealthCheck.too_slow])
-    @given(password=st.text(min_size=1, max_size=50))
+    @settings(max_examples=25, derandomize=True, deadline=100)
+    @given(password=_PASSWORD_STRATEGY)
     def test_password_hash_consistency(self, password: str):
         """
         Property 1: Password Hash Consistency
@@ -22,13 +38,9 @@ class TestPasswordServicePropertyBased:
 
         Validates: Requirements 2.1, 9.1
         """
-        # Skip empty or whitespace-only passwords
-        if not password or not password.strip():
-            return
-
         try:
             # Hash the password
-            hashed = PasswordService.hash_password(password)
+            hashed = _cached_hash(password)
 
             # Verify the same password returns True
             assert PasswordService.verify_password(password, hashed) is True
@@ -44,17 +56,14 @@ class TestPasswordServicePropertyBased:
 class TestPasswordServiceUnit:
     """Unit tests for PasswordService."""
 
-    def test_hash_password_creates_valid_hash(self):
+    def test_hash_password_creates_valid_hash(self, bcrypt_hash):
         """Test that hash_password creates a valid bcrypt hash."""
-        password = "SecurePassword123!"
-        hashed = PasswordService.hash_password(password)
-
         # Hash should be a non-empty string
-        assert isinstance(hashed, str)
-        assert len(hashed) > 0
+        assert isinstance(bcrypt_hash, str)
+        assert len(bcrypt_hash) > 0
 
         # Hash should start with $2 (bcrypt identifier)
-        assert hashed.startswith("$2")
+        assert bcrypt_hash.startswith("$2")
 
     def test_hash_password_different_hashes_for_same_password(self):
         """Test that hashing the same password twice produces different hashes."""
@@ -79,26 +88,18 @@ class TestPasswordServiceUnit:
         with pytest.raises(ValueError, match="Password cannot be empty"):
             PasswordService.hash_password(None)  # type: ignore
 
-    def test_verify_password_correct_password(self):
+    def test_verify_password_correct_password(self, bcrypt_hash):
         """Test that verify_password returns True for correct password."""
-        password = "SecurePassword123!"
-        hashed = PasswordService.hash_password(password)
-
-        assert PasswordService.verify_password(password, hashed) is True
+        assert PasswordService.verify_password("SecurePassword123!", bcrypt_hash) is True
 
-    def test_verify_password_incorrect_password(self):
+    def test_verify_password_incorrect_password(self, bcrypt_hash):
         """Test that verify_password returns False for incorrect password."""
-        password = "SecurePassword123!"
-        hashed = PasswordService.hash_password(password)
-
-        assert PasswordService.verify_password("WrongPassword456!", hashed) is False
+        assert PasswordService.verify_password("WrongPassword456!", bcrypt_hash) is False
 
-    def test_verify_password_empty_password_raises_error(self):
+    def test_verify_password_empty_password_raises_error(self, bcrypt_hash):
         """Test that verifying with empty password raises ValueError."""
-        hashed = PasswordService.hash_password("SecurePassword123!")
-
         with pytest.raises(ValueError, match="Password and hash cannot be empty"):
-            PasswordService.verify_password("", hashed)
+            PasswordService.verify_password("", bcrypt_hash)
 
     def test_verify_password_empty_hash_raises_error(self):
         """Test that verifying with empty hash raises ValueError."""
@@ -110,61 +111,6 @@ class TestPasswordServiceUnit:
         result = PasswordService.verify_password("SecurePassword123!", "invalid_hash")
         assert result is False
 
-    def test_validate_password_strength_strong_password(self):
-        """Test that strong password passes validation."""
-        password = "SecurePassword123!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validate_password_strength_weak_password_too_short(self):
-        """Test that short password fails validation."""
-        password = "Short1!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is False
-        assert any("at least 8 characters" in error for error in errors)
-
-    def test_validate_password_strength_no_uppercase(self):
-        """Test that password without uppercase fails validation."""
-        password = "securepassword123!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is False
-        assert any("uppercase" in error for error in errors)
-
-    def test_validate_password_strength_no_lowercase(self):
-        """Test that password without lowercase fails validation."""
-        password = "SECUREPASSWORD123!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is False
-        assert any("lowercase" in error for error in errors)
-
-    def test_validate_password_strength_no_digit(self):
-        """Test that password without digit fails validation."""
-        password = "SecurePassword!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is False
-        assert any("digit" in error for error in errors)
-
-    def test_validate_password_strength_no_special_character(self):
-        """Test that password without special character fails validation."""
-        password = "SecurePassword123"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is False
-        assert any("special character" in error for error in errors)
-
-    def test_validate_password_strength_empty_password(self):
-        """Test that empty password fails validation."""
-        is_valid, errors = PasswordService.validate_password_strength("")
-
-        assert is_valid is False
-        assert any("cannot be empty" in error for error in errors)
-
     def test_validate_password_strength_multiple_errors(self):
         """Test that password with multiple issues returns all errors."""
         password = "weak"
@@ -173,26 +119,33 @@ class TestPasswordServiceUnit:
         assert is_valid is False
         assert len(errors) >= 3  # Should have multiple errors
 
-    def test_validate_password_strength_special_characters_accepted(self):
-        """Test that various special characters are accepted."""
-        special_chars = "!@#$%^&*"
-        for char in special_chars:
-            password = f"SecurePassword123{char}"
-            is_valid, _ = PasswordService.validate_password_strength(password)
-            assert is_valid is True, f"Special character '{char}' should be accepted"
-
-    def test_validate_password_strength_edge_case_exactly_8_chars(self):
-        """Test password with exactly 8 characters (minimum length)."""
-        password = "Secure1!"
-        is_valid, errors = PasswordService.validate_password_strength(password)
-
-        assert is_valid is True
-        assert len(errors) == 0
-
-    def test_validate_password_strength_long_password(self):
-        """Test that long password passes validation."""
-        password = "VeryLongSecurePassword123!@#$%^&*"
+    @pytest.mark.parametrize("char", list("!@#$%^&*"))
+    def test_validate_password_strength_special_characters_accepted(self, char):
+        """Test that each supported special character is accepted."""
+        is_valid, errors = PasswordService.validate_password_strength(f"SecurePassword123{char}")
+
+        assert is_valid is True, errors
+
+    @pytest.mark.parametrize(
+        ("password", "expect_valid", "expected_error"),
+        [
+            pytest.param("SecurePassword123!", True, None, id="strong"),
+            pytest.param("Short1!", False, "at least 8 characters", id="too-short"),
+            pytest.param("securepassword123!", False, "uppercase", id="no-uppercase"),
+            pytest.param("SECUREPASSWORD123!", False, "lowercase", id="no-lowercase"),
+            pytest.param("SecurePassword!", False, "digit", id="no-digit"),
+            pytest.param("SecurePassword123", False, "special character", id="no-special"),
+            pytest.param("", False, "cannot be empty", id="empty"),
+            pytest.param("Secure1!", True, None, id="exactly-8-chars"),
+            pytest.param("VeryLongSecurePassword123!@#$%^&*", True, None, id="long"),
+        ],
+    )
+    def test_validate_password_strength(self, password, expect_valid, expected_error):
+        """Test password strength validation against each requirement."""
         is_valid, errors = PasswordService.validate_password_strength(password)
 
-        assert is_valid is True
-        assert len(errors) == 0
+        assert is_valid is expect_valid
+        if expected_error is None:
+            assert len(errors) == 0
+        else:
+            assert any(expected_error in error for error in errors)
@@ -3,126 +3,225 @@
 import json
 import uuid
 from datetime import UTC, datetime, timedelta
+from types import SimpleNamespace
 
+import httpx
 import pytest
 from fastapi import status
-from fastapi.testclient import TestClient
-from sqlalchemy.orm import Session
+from sqlalchemy import insert
+from sqlalchemy.orm import Session, sessionmaker
+
+from main import app
+from src.database.db import get_db
+from src.database.models import Base, MarketDataRecord, TipRecord
+from src.services.authentication_service import AuthenticationService
+
+# Reference time for sample records; taken once so dates stay inside the
+# endpoints' lookback windows without reading the clock per row
+_NOW = datetime.now(UTC)
+
+# Serialized payloads shared by every sample record
+_INDICATORS_JSON = json.dumps(["RSI", "MACD"])
+_SOURCES_JSON = json.dumps([{"name": "Test Source", "url": "https://example.com"}])
+_HISTORICAL_DATA_JSON = json.dumps(
+    {"period": "24h", "prices": [99.0, 100.0, 101.0], "timestamps": [1, 2, 3]}
+)
+
+# Acceptable statuses for bad credentials: HTTPBearer answers 403 when it cannot
+# parse the header, the token check answers 401 once it has a token
+_REJECTED = (status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN)
+_UNAUTHORIZED = (status.HTTP_401_UNAUTHORIZED,)
+
+# Every protected route, with a request body where the route expects one
+UNAUTH_ROUTES = [
+    pytest.param("GET", "/api/tips", None, id="get-tips"),
+    pytest.param("POST", "/api/tips/generate", None, id="generate-tips"),
+    pytest.param("GET", "/api/market-data", None, id="get-market-data"),
+    pytest.param("GET", "/api/tip-history", None, id="get-tip-history"),
+    pytest.param(
+        "POST",
+        "/api/users",
+        {
+            "email": "newuser@example.com",
+            "morning_time": "08:00",
+            "evening_time": "18:00",
+            "asset_preferences": ["crypto"],
+        },
+        id="create-user",
+    ),
+    pytest.param("GET", "/api/users/123", None, id="get-user"),
+    pytest.param("GET", "/api/users/email/test@example.com", None, id="get-user-by-email"),
+    pytest.param("PUT", "/api/users/123", {"email": "updated@example.com"}, id="update-user"),
+    pytest.param("DELETE", "/api/users/123", None, id="delete-user"),
+    pytest.param("GET", "/api/user/profile", None, id="get-profile"),
+    pytest.param("PUT", "/api/user/profile", {"name": "Test"}, id="update-profile"),
+    pytest.param(
+        "POST",
+        "/api/user/change-password",
+        {"current_password": "old", "new_password": "new"},
+        id="change-password",
+    ),
+    pytest.param(
+        "POST", "/api/user/disconnect-oauth", {"provider": "google"}, id="disconnect-oauth"
+    ),
+    pytest.param("DELETE", "/api/user/account", None, id="delete-account"),
+]
+
+# State-changing routes that also require a CSRF token
+CSRF_ROUTES = [
+    pytest.param("PUT", "/api/user/profile", {"name": "Updated Name"}, id="update-profile"),
+    pytest.param(
+        "POST",
+        "/api/user/change-password",
+        {"current_password": "old", "new_password": "NewPassword123!"},
+        id="change-password",
+    ),
+    pytest.param(
+        "POST", "/api/user/disconnect-oauth", {"provider": "google"}, id="disconnect-oauth"
+    ),
+    pytest.param("DELETE", "/api/user/account", None, id="delete-account"),
+]
+
+
+def _register_and_login(test_db, users: list[dict]) -> list[dict]:
+    """
+    Register and log in each user, committing outside any per-test transaction.
+
+    Setup only needs tokens, so it calls AuthenticationService directly rather
+    than going through the auth routes, which have their own tests.
+
+    Returns one dict of user data, tokens and Authorization headers per user.
+    """
+    session = sessionmaker(autocommit=False, autoflush=False, bind=test_db)()
+    try:
+        auth_service = AuthenticationService(session)
+        accounts = []
+        for user_data in users:
+            user = auth_service.register(**user_data)
+            tokens = auth_service.login(user_data["email"], user_data["password"])
+
+            accounts.append(
+                {
+                    "user": {"id": user.id, "email": user.email, "name": user.name},
+                    "tokens": tokens.model_dump(),
+                    "headers": {"Authorization": f"Bearer {tokens.access_token}"},
+                }
+            )
+    finally:
+        session.close()
+
+    return accounts
+
+
+def _delete_all_rows(test_db) -> None:
+    """Remove data committed by the module-scoped user fixtures."""
+    with test_db.begin() as connection:
+        for table in reversed(Base.metadata.sorted_tables):
+            connection.execute(table.delete())
+
+
+@pytest.fixture(scope="module")
+def authenticated_user(test_db):
+    """
+    Create and authenticate a test user once per module, return user data and tokens.
+
+    Registration and login are committed outside the per-test transaction so the
+    password hash and token signing run once; the data is removed at module end.
+    """
+    user_data = {"email": "testuser@example.com", "password": "SecurePass123!", "name": "Test User"}
+    (account,) = _register_and_login(test_db, [user_data])
 
-from src.database.models import MarketDataRecord, TipRecord
+    yield account
+
+    _delete_all_rows(test_db)
+
+
+@pytest.fixture(scope="module")
+def two_authenticated_users(test_db):
+    """Create and authenticate two distinct users once per module, for isolation tests."""
+    users = [
+        {"email": "user1@example.com", "password": "SecurePassword123!", "name": "User 1"},
+        {"email": "user2@example.com", "password": "SecurePassword123!", "name": "User 2"},
+    ]
+
+    yield _register_and_login(test_db, users)
+
+    _delete_all_rows(test_db)
 
 
 @pytest.fixture
-def authenticated_user(test_client: TestClient):
-    """Create and authenticate a test user, return user data and tokens."""
-    # Register a user
-    user_data = {
-        "email": "testuser@example.com",
-        "password": "SecurePass123!",
-        "name": "Test User",
-    }
-    register_response = test_client.post("/auth/register", json=user_data)
-    assert register_response.status_code == status.HTTP_201_CREATED
-    user_info = register_response.json()
-
-    # Login to get tokens
-    login_data = {"email": user_data["email"], "password": user_data["password"]}
-    login_response = test_client.post("/auth/login", json=login_data)
-    assert login_response.status_code == status.HTTP_200_OK
-    tokens = login_response.json()
-
-    return {
-        "user": user_info,
-        "tokens": tokens,
-        "headers": {"Authorization": f"Bearer {tokens['access_token']}"},
-    }
+def auth_client(async_client: httpx.AsyncClient, authenticated_user):
+    """The async test client with the test user's Authorization header preset."""
+    async_client.headers.update(authenticated_user["headers"])
+    return async_client
+
+
+@pytest.fixture
+def stub_tip_generation(monkeypatch):
+    """Replace the tip-generation pipeline; these tests only cover authentication."""
+    scheduler = SimpleNamespace(db_session=None, execute_delivery=lambda delivery_type: None)
+    monkeypatch.setattr("src.api.routes.get_scheduler_service", lambda: scheduler)
+    return scheduler
 
 
 @pytest.fixture
 def sample_tips(test_session: Session):
     """Create sample tip records for testing."""
-    tips = []
-
     # Create tips from different dates
-    for i in range(5):
-        tip = TipRecord(
-            id=str(uuid.uuid4()),
-            symbol="BTC" if i % 2 == 0 else "AAPL",
-            type="crypto" if i % 2 == 0 else "stock",
-            recommendation=["BUY", "SELL", "HOLD"][i % 3],
-            reasoning=f"Test reasoning {i}",
-            confidence=50 + (i * 10),
-            indicators=json.dumps(["RSI", "MACD"]),
-            sources=json.dumps([{"name": "Test Source", "url": "https://example.com"}]),
-            generated_at=datetime.now(UTC) - timedelta(days=i),
-            delivery_type="morning" if i % 2 == 0 else "evening",
-        )
-        test_session.add(tip)
-        tips.append(tip)
+    tips = [
+        {
+            "id": str(uuid.UUID(int=i)),
+            "symbol": "BTC" if i % 2 == 0 else "AAPL",
+            "type": "crypto" if i % 2 == 0 else "stock",
+            "recommendation": ["BUY", "SELL", "HOLD"][i % 3],
+            "reasoning": f"Test reasoning {i}",
+            "confidence": 50 + (i * 10),
+            "indicators": _INDICATORS_JSON,
+            "sources": _SOURCES_JSON,
+            "generated_at": _NOW - timedelta(days=i),
+            "delivery_type": "morning" if i % 2 == 0 else "evening",
+        }
+        for i in range(5)
+    ]
 
-    test_session.commit()
+    test_session.execute(insert(TipRecord), tips)
+    test_session.flush()
     return tips
 
 
 @pytest.fixture
 def sample_market_data(test_session: Session):
     """Create sample market data records for testing."""
-    data = []
-
-    symbols = ["BTC", "ETH", "AAPL", "GOOGL"]
-    for symbol in symbols:
-        record = MarketDataRecord(
-            id=str(uuid.uuid4()),
-            symbol=symbol,
-            type="crypto" if symbol in ["BTC", "ETH"] else "stock",
-            current_price=100.0 + len(data),
-            price_change_24h=2.5,
-            volume_24h=1000000.0,
-            historical_data=json.dumps(
-                {"period": "24h", "prices": [99.0, 100.0, 101.0], "timestamps": [1, 2, 3]}
-            ),
-            source_name="Test Exchange",
-            source_url="https://example.com",
-            fetched_at=datetime.now(UTC),
-        )
-        test_session.add(record)
-        data.append(record)
+    data = [
+        {
+            "id": str(uuid.UUID(int=1000 + i)),
+            "symbol": symbol,
+            "type": "crypto" if symbol in ["BTC", "ETH"] else "stock",
+            "current_price": 100.0 + i,
+            "price_change_24h": 2.5,
+            "volume_24h": 1000000.0,
+            "historical_data": _HISTORICAL_DATA_JSON,
+            "source_name": "Test Exchange",
+            "source_url": "https://example.com",
+            "fetched_at": _NOW,
+        }
+        for i, symbol in enumerate(["BTC", "ETH", "AAPL", "GOOGL"])
+    ]
 
-    test_session.commit()
+    test_session.execute(insert(MarketDataRecord), data)
+    test_session.flush()
     return data
 
 
 class TestDashboardEndpointsAuthentication:
     """Tests for dashboard endpoints requiring authentication."""
 
-    def test_get_tips_requires_authentication(self, test_client: TestClient, sample_tips):
-        """Test that GET /api/tips requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.get("/api/tips")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-        response_data = response.json()
-        assert "detail" in response_data
-        assert "not authenticated" in response_data["detail"].lower()
-
-    def test_get_tips_with_invalid_token(self, test_client: TestClient, sample_tips):
-        """Test that GET /api/tips rejects invalid tokens."""
-        # Act - Request with invalid token
-        headers = {"Authorization": "Bearer invalid.token.here"}
-        response = test_client.get("/api/tips", headers=headers)
-
-        # Assert
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        response_data = response.json()
-        assert "detail" in response_data
-
-    def test_get_tips_with_valid_authentication(
-        self, test_client: TestClient, authenticated_user, sample_tips
+    async def test_get_tips_with_valid_authentication(
+        self, auth_client: httpx.AsyncClient, authenticated_user, sample_tips
     ):
         """Test that GET /api/tips works with valid authentication."""
         # Act - Request with valid token
-        response = test_client.get("/api/tips", headers=authenticated_user["headers"])
+        response = await auth_client.get("/api/tips")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -132,22 +231,12 @@ class TestDashboardEndpointsAuthentication:
         assert "user_id" in data  # Verify user context is available
         assert data["user_id"] == authenticated_user["user"]["id"]
 
-    def test_get_market_data_requires_authentication(
-        self, test_client: TestClient, sample_market_data
-    ):
-        """Test that GET /api/market-data requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.get("/api/market-data")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_get_market_data_with_valid_authentication(
-        self, test_client: TestClient, authenticated_user, sample_market_data
+    async def test_get_market_data_with_valid_authentication(
+        self, auth_client: httpx.AsyncClient, sample_market_data
     ):
         """Test that GET /api/market-data works with valid authentication."""
         # Act - Request with valid token
-        response = test_client.get("/api/market-data", headers=authenticated_user["headers"])
+        response = await auth_client.get("/api/market-data")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -155,20 +244,12 @@ class TestDashboardEndpointsAuthentication:
         assert "market_data" in data
         assert "count" in data
 
-    def test_get_tip_history_requires_authentication(self, test_client: TestClient, sample_tips):
-        """Test that GET /api/tip-history requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.get("/api/tip-history")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_get_tip_history_with_valid_authentication(
-        self, test_client: TestClient, authenticated_user, sample_tips
+    async def test_get_tip_history_with_valid_authentication(
+        self, auth_client: httpx.AsyncClient, sample_tips
     ):
         """Test that GET /api/tip-history works with valid authentication."""
         # Act - Request with valid token
-        response = test_client.get("/api/tip-history", headers=authenticated_user["headers"])
+        response = await auth_client.get("/api/tip-history")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -177,20 +258,12 @@ class TestDashboardEndpointsAuthentication:
         assert "total" in data
         assert "days" in data
 
-    def test_generate_tips_requires_authentication(self, test_client: TestClient):
-        """Test that POST /api/tips/generate requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.post("/api/tips/generate")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_generate_tips_with_valid_authentication(
-        self, test_client: TestClient, authenticated_user
+    async def test_generate_tips_with_valid_authentication(
+        self, auth_client: httpx.AsyncClient, authenticated_user, stub_tip_generation
     ):
         """Test that POST /api/tips/generate works with valid authentication."""
         # Act - Request with valid token
-        response = test_client.post("/api/tips/generate", headers=authenticated_user["headers"])
+        response = await auth_client.post("/api/tips/generate")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -204,25 +277,7 @@ class TestDashboardEndpointsAuthentication:
 class TestUserManagementEndpointsAuthentication:
     """Tests for user management endpoints requiring authentication."""
 
-    def test_create_user_requires_authentication(self, test_client: TestClient):
-        """Test that POST /api/users requires valid authentication."""
-        # Arrange
-        user_data = {
-            "email": "newuser@example.com",
-            "morning_time": "08:00",
-            "evening_time": "18:00",
-            "asset_preferences": ["crypto"],
-        }
-
-        # Act - Request without authentication
-        response = test_client.post("/api/users", json=user_data)
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_create_user_with_valid_authentication(
-        self, test_client: TestClient, authenticated_user
-    ):
+    async def test_create_user_with_valid_authentication(self, auth_client: httpx.AsyncClient):
         """Test that POST /api/users works with valid authentication."""
         # Arrange
         user_data = {
@@ -233,9 +288,7 @@ class TestUserManagementEndpointsAuthentication:
         }
 
         # Act - Request with valid token
-        response = test_client.post(
-            "/api/users", json=user_data, headers=authenticated_user["headers"]
-        )
+        response = await auth_client.post("/api/users", json=user_data)
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -243,91 +296,58 @@ class TestUserManagementEndpointsAuthentication:
         assert "id" in data
         assert data["email"] == user_data["email"]
 
-    def test_get_user_requires_authentication(self, test_client: TestClient):
-        """Test that GET /api/users/{user_id} requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.get("/api/users/123")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_get_user_with_valid_authentication_own_profile(
-        self, test_client: TestClient, authenticated_user
+    async def test_get_user_with_valid_authentication_own_profile(
+        self, auth_client: httpx.AsyncClient, authenticated_user
     ):
         """Test that users can access their own profile with valid authentication."""
         # Act - Request own profile with valid token
         user_id = str(authenticated_user["user"]["id"])
-        response = test_client.get(f"/api/users/{user_id}", headers=authenticated_user["headers"])
+        response = await auth_client.get(f"/api/users/{user_id}")
 
         # Assert - Should fail because the user service expects different user model
         # This test verifies authentication works, even if the endpoint logic has issues
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
 
-    def test_get_user_with_valid_authentication_other_profile(
-        self, test_client: TestClient, authenticated_user
+    async def test_get_user_with_valid_authentication_other_profile(
+        self, auth_client: httpx.AsyncClient
     ):
         """Test that users cannot access other users' profiles."""
         # Act - Request another user's profile with valid token
         other_user_id = "999"  # Different user ID
-        response = test_client.get(
-            f"/api/users/{other_user_id}", headers=authenticated_user["headers"]
-        )
+        response = await auth_client.get(f"/api/users/{other_user_id}")
 
         # Assert
         assert response.status_code == status.HTTP_403_FORBIDDEN
         response_data = response.json()
         assert "access denied" in response_data["detail"].lower()
 
-    def test_get_user_by_email_requires_authentication(self, test_client: TestClient):
-        """Test that GET /api/users/email/{email} requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.get("/api/users/email/test@example.com")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_get_user_by_email_with_valid_authentication_own_email(
-        self, test_client: TestClient, authenticated_user
+    async def test_get_user_by_email_with_valid_authentication_own_email(
+        self, auth_client: httpx.AsyncClient, authenticated_user
     ):
         """Test that users can access their own profile by email with valid authentication."""
         # Act - Request own profile by email with valid token
         email = authenticated_user["user"]["email"]
-        response = test_client.get(
-            f"/api/users/email/{email}", headers=authenticated_user["headers"]
-        )
+        response = await auth_client.get(f"/api/users/email/{email}")
 
         # Assert - Should fail because the user service expects different user model
         # This test verifies authentication works, even if the endpoint logic has issues
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
 
-    def test_get_user_by_email_with_valid_authentication_other_email(
-        self, test_client: TestClient, authenticated_user
+    async def test_get_user_by_email_with_valid_authentication_other_email(
+        self, auth_client: httpx.AsyncClient
     ):
         """Test that users cannot access other users' profiles by email."""
         # Act - Request another user's profile by email with valid token
         other_email = "other@example.com"
-        response = test_client.get(
-            f"/api/users/email/{other_email}", headers=authenticated_user["headers"]
-        )
+        response = await auth_client.get(f"/api/users/email/{other_email}")
 
         # Assert
         assert response.status_code == status.HTTP_403_FORBIDDEN
         response_data = response.json()
         assert "access denied" in response_data["detail"].lower()
 
-    def test_update_user_requires_authentication(self, test_client: TestClient):
-        """Test that PUT /api/users/{user_id} requires valid authentication."""
-        # Arrange
-        update_data = {"email": "updated@example.com"}
-
-        # Act - Request without authentication
-        response = test_client.put("/api/users/123", json=update_data)
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_update_user_with_valid_authentication_own_profile(
-        self, test_client: TestClient, authenticated_user
+    async def test_update_user_with_valid_authentication_own_profile(
+        self, auth_client: httpx.AsyncClient, authenticated_user
     ):
         """Test that users can update their own profile with valid authentication."""
         # Arrange
@@ -335,16 +355,14 @@ class TestUserManagementEndpointsAuthentication:
         user_id = str(authenticated_user["user"]["id"])
 
         # Act - Request with valid token
-        response = test_client.put(
-            f"/api/users/{user_id}", json=update_data, headers=authenticated_user["headers"]
-        )
+        response = await auth_client.put(f"/api/users/{user_id}", json=update_data)
 
         # Assert - Should fail because the user service expects different user model
         # This test verifies authentication works, even if the endpoint logic has issues
         assert response.status_code in [status.HTTP_200_OK, status.HTTP_404_NOT_FOUND]
 
-    def test_update_user_with_valid_authentication_other_profile(
-        self, test_client: TestClient, authenticated_user
+    async def test_update_user_with_valid_authentication_other_profile(
+        self, auth_client: httpx.AsyncClient
     ):
         """Test that users cannot update other users' profiles."""
         # Arrange
@@ -352,34 +370,22 @@ class TestUserManagementEndpointsAuthentication:
         other_user_id = "999"  # Different user ID
 
         # Act - Request with valid token
-        response = test_client.put(
-            f"/api/users/{other_user_id}", json=update_data, headers=authenticated_user["headers"]
-        )
+        response = await auth_client.put(f"/api/users/{other_user_id}", json=update_data)
 
         # Assert
         assert response.status_code == status.HTTP_403_FORBIDDEN
         response_data = response.json()
         assert "access denied" in response_data["detail"].lower()
 
-    def test_delete_user_requires_authentication(self, test_client: TestClient):
-        """Test that DELETE /api/users/{user_id} requires valid authentication."""
-        # Act - Request without authentication
-        response = test_client.delete("/api/users/123")
-
-        # Assert
-        assert response.status_code == status.HTTP_403_FORBIDDEN
-
-    def test_delete_user_with_valid_authentication_other_profile(
-        self, test_client: TestClient, authenticated_user
+    async def test_delete_user_with_valid_authentication_other_profile(
+        self, auth_client: httpx.AsyncClient
     ):
         """Test that users cannot delete other users' profiles."""
         # Arrange
         other_user_id = "999"  # Different user ID
 
         # Act - Request with valid token
-        response = test_client.delete(
-            f"/api/users/{other_user_id}", headers=authenticated_user["headers"]
-        )
+        response = await auth_client.delete(f"/api/users/{other_user_id}")
 
         # Assert
         assert response.status_code == status.HTTP_403_FORBIDDEN
@@ -390,51 +396,32 @@ class TestUserManagementEndpointsAuthentication:
 class TestExpiredTokenHandling:
     """Tests for handling expired tokens."""
 
-    def test_expired_access_token_rejected(self, test_client: TestClient, sample_tips):
-        """Test that expired access tokens are rejected."""
-        # Create a token that's already expired (this would require mocking the token service)
-        # For now, we'll test with a malformed token that will fail validation
-        headers = {"Authorization": "Bearer expired.token.here"}
-
-        # Act
-        response = test_client.get("/api/tips", headers=headers)
-
-        # Assert
-        assert response.status_code == status.HTTP_401_UNAUTHORIZED
-        response_data = response.json()
-        assert "detail" in response_data
-
-    def test_expired_token_on_multiple_endpoints(
-        self, test_client: TestClient, sample_tips, sample_market_data
-    ):
+    async def test_expired_token_on_multiple_endpoints(self, async_client: httpx.AsyncClient):
         """Test that expired tokens are rejected across all protected endpoints."""
         headers = {"Authorization": "Bearer expired.token.here"}
 
-        # Test multiple protected endpoints
+        # Test multiple protected endpoints one after another; every request
+        # shares the test's database session, which must not be used concurrently
         endpoints = [
-            "/api/tips",
-            "/api/market-data",
-            "/api/tip-history",
-            "/api/tips/generate",
-            "/api/user/profile",
+            ("GET", "/api/tips"),
+            ("GET", "/api/market-data"),
+            ("GET", "/api/tip-history"),
+            ("POST", "/api/tips/generate"),
+            ("GET", "/api/user/profile"),
         ]
 
-        for endpoint in endpoints:
-            if endpoint == "/api/tips/generate":
-                response = test_client.post(endpoint, headers=headers)
-            else:
-                response = test_client.get(endpoint, headers=headers)
+        for method, url in endpoints:
+            response = await async_client.request(method, url, headers=headers)
 
-            assert response.status_code == status.HTTP_401_UNAUTHORIZED
-            response_data = response.json()
-            assert "detail" in response_data
+            # The response body is covered by test_bad_authorization_rejected
+            assert response.status_code == status.HTTP_401_UNAUTHORIZED, f"{method} {url}"
 
 
 class TestTokenTypeValidation:
     """Tests for validating token types."""
 
-    def test_refresh_token_rejected_for_api_access(
-        self, test_client: TestClient, authenticated_user, sample_tips
+    async def test_refresh_token_rejected_for_api_access(
+        self, async_client: httpx.AsyncClient, authenticated_user
     ):
         """Test that refresh tokens are rejected for API access."""
         # Arrange - Use refresh token instead of access token
@@ -442,7 +429,7 @@ class TestTokenTypeValidation:
         headers = {"Authorization": f"Bearer {refresh_token}"}
 
         # Act
-        response = test_client.get("/api/tips", headers=headers)
+        response = await async_client.get("/api/tips", headers=headers)
 
         # Assert
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
@@ -455,12 +442,12 @@ class TestTokenTypeValidation:
 class TestUserContextAvailability:
     """Tests to verify user context is available in route handlers."""
 
-    def test_user_context_in_tips_endpoint(
-        self, test_client: TestClient, authenticated_user, sample_tips
+    async def test_user_context_in_tips_endpoint(
+        self, auth_client: httpx.AsyncClient, authenticated_user
     ):
         """Test that user context is available in tips endpoint."""
         # Act
-        response = test_client.get("/api/tips", headers=authenticated_user["headers"])
+        response = await auth_client.get("/api/tips")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -468,12 +455,12 @@ class TestUserContextAvailability:
         assert "user_id" in data
         assert data["user_id"] == authenticated_user["user"]["id"]
 
-    def test_user_context_in_generate_tips_endpoint(
-        self, test_client: TestClient, authenticated_user
+    async def test_user_context_in_generate_tips_endpoint(
+        self, auth_client: httpx.AsyncClient, authenticated_user, stub_tip_generation
     ):
         """Test that user context is available in generate tips endpoint."""
         # Act
-        response = test_client.post("/api/tips/generate", headers=authenticated_user["headers"])
+        response = await auth_client.post("/api/tips/generate")
 
         # Assert
         assert response.status_code == status.HTTP_200_OK
@@ -485,227 +472,112 @@ class TestUserContextAvailability:
 class TestProtectedEndpointAccessControl:
     """Tests for access control on protected endpoints."""
 
-    def test_all_user_routes_require_authentication(self, test_client: TestClient):
-        """Test that all user management routes require authentication."""
-        user_routes = [
-            ("/api/user/profile", "GET"),
-            ("/api/user/profile", "PUT"),
-            ("/api/user/change-password", "POST"),
-            ("/api/user/disconnect-oauth", "POST"),
-            ("/api/user/account", "DELETE"),
-        ]
-
-        for route, method in user_routes:
-            if method == "GET":
-                response = test_client.get(route)
-            elif method == "PUT":
-                response = test_client.put(route, json={"name": "Test"})
-            elif method == "POST":
-                if "change-password" in route:
-                    response = test_client.post(
-                        route, json={"current_password": "old", "new_password": "new"}
-                    )
-                elif "disconnect-oauth" in route:
-                    response = test_client.post(route, json={"provider": "google"})
-                else:
-                    response = test_client.post(route, json={})
-            elif method == "DELETE":
-                response = test_client.delete(route)
-
-            assert response.status_code == status.HTTP_403_FORBIDDEN, (
-                f"Route {method} {route} should require authentication"
-            )
-
-    def test_all_dashboard_routes_require_authentication(self, test_client: TestClient):
-        """Test that all dashboard routes require authentication."""
-        dashboard_routes = [
-            ("/api/tips", "GET"),
-            ("/api/tips/generate", "POST"),
-            ("/api/market-data", "GET"),
-            ("/api/tip-history", "GET"),
-        ]
-
-        for route, method in dashboard_routes:
-            if method == "GET":
-                response = test_client.get(route)
-            elif method == "POST":
-                response = test_client.post(route)
+    @pytest.mark.parametrize(("method", "url", "body"), UNAUTH_ROUTES)
+    async def test_requires_authentication(
+        self, async_client: httpx.AsyncClient, method, url, body
+    ):
+        """Test that every protected route rejects requests without authentication."""
+        response = await async_client.request(method, url, json=body)
 
-            assert response.status_code == status.HTTP_403_FORBIDDEN, (
-                f"Route {method} {route} should require authentication"
-            )
+        assert response.status_code == status.HTTP_403_FORBIDDEN
 
-    def test_csrf_protected_endpoints_require_csrf_token(
-        self, test_client: TestClient, authenticated_user
+    @pytest.mark.parametrize(("method", "url", "body"), CSRF_ROUTES)
+    async def test_csrf_protected_endpoints_require_csrf_token(
+        self, auth_client: httpx.AsyncClient, method, url, body
     ):
         """Test that CSRF-protected endpoints require valid CSRF token."""
-        csrf_protected_routes = [
-            ("/api/user/profile", "PUT", {"name": "Updated Name"}),
-            (
-                "/api/user/change-password",
-                "POST",
-                {"current_password": "old", "new_password": "NewPassword123!"},
-            ),
-            ("/api/user/disconnect-oauth", "POST", {"provider": "google"}),
-            ("/api/user/account", "DELETE", {}),
-        ]
+        response = await auth_client.request(method, url, json=body)
 
-        for route, method, data in csrf_protected_routes:
-            if method == "PUT":
-                response = test_client.put(route, json=data, headers=authenticated_user["headers"])
-            elif method == "POST":
-                response = test_client.post(route, json=data, headers=authenticated_user["headers"])
-            elif method == "DELETE":
-                response = test_client.delete(route, headers=authenticated_user["headers"])
-
-            # Should fail due to missing CSRF token
-            assert response.status_code in [
-                status.HTTP_403_FORBIDDEN,
-                status.HTTP_400_BAD_REQUEST,
-            ], f"Route {method} {route} should require CSRF token"
+        # Should fail due to missing CSRF token
+        assert response.status_code in [status.HTTP_403_FORBIDDEN, status.HTTP_400_BAD_REQUEST]
 
 
 class TestProtectedEndpointErrorHandling:
     """Tests for error handling in protected endpoints."""
 
-    def test_malformed_authorization_header(self, test_client: TestClient, sample_tips):
-        """Test handling of malformed Authorization headers."""
-        malformed_headers = [
-            {"Authorization": "Bearer"},  # Missing token
-            {"Authorization": "Basic token"},  # Wrong auth type
-            {"Authorization": "Bearer "},  # Empty token
-            {"Authorization": "token"},  # Missing Bearer prefix
-        ]
+    @pytest.mark.parametrize(
+        ("authorization", "expected_statuses"),
+        [
+            pytest.param("Bearer", _REJECTED, id="missing-token"),
+            pytest.param("Basic token", _REJECTED, id="wrong-auth-type"),
+            pytest.param("Bearer ", _REJECTED, id="empty-token"),
+            pytest.param("token", _REJECTED, id="missing-bearer-prefix"),
+            pytest.param("Bearer invalid.token", _REJECTED, id="too-few-parts"),
+            pytest.param("Bearer invalid.token.format.extra", _REJECTED, id="too-many-parts"),
+            pytest.param("Bearer invalid_token_no_dots", _REJECTED, id="no-dots"),
+            pytest.param("Bearer invalid.token.here", _UNAUTHORIZED, id="invalid-token"),
+            pytest.param("Bearer expired.token.here", _UNAUTHORIZED, id="expired-token"),
+        ],
+    )
+    async def test_bad_authorization_rejected(
+        self, async_client: httpx.AsyncClient, authorization, expected_statuses
+    ):
+        """Test that malformed, invalid and expired credentials are rejected."""
+        response = await async_client.get("/api/tips", headers={"Authorization": authorization})
 
-        for headers in malformed_headers:
-            response = test_client.get("/api/tips", headers=headers)
-            assert response.status_code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
+        assert response.status_code in expected_statuses
+        assert "detail" in response.json()
 
-    def test_missing_authorization_header(self, test_client: TestClient, sample_tips):
+    async def test_missing_authorization_header(self, async_client: httpx.AsyncClient):
         """Test handling of missing Authorization header."""
-        response = test_client.get("/api/tips")
+        response = await async_client.get("/api/tips")
         assert response.status_code == status.HTTP_403_FORBIDDEN
         response_data = response.json()
         assert "detail" in response_data
         assert "not authenticated" in response_data["detail"].lower()
 
-    def test_invalid_token_format(self, test_client: TestClient, sample_tips):
-        """Test handling of invalid token formats."""
-        invalid_tokens = [
-            "invalid.token",  # Not enough parts
-            "invalid.token.format.extra",  # Too many parts
-            "invalid_token_no_dots",  # No dots
-            "",  # Empty token
-        ]
-
-        for token in invalid_tokens:
-            headers = {"Authorization": f"Bearer {token}"}
-            response = test_client.get("/api/tips", headers=headers)
-            # Both 401 and 403 are acceptable for invalid token formats
-            assert response.status_code in [status.HTTP_401_UNAUTHORIZED, status.HTTP_403_FORBIDDEN]
-
-    def test_network_timeout_simulation(self, test_client: TestClient, authenticated_user):
-        """Test that endpoints handle network issues gracefully."""
-        # This test verifies that the endpoint doesn't crash on network issues
-        # In a real scenario, this would test database connection timeouts, etc.
-        response = test_client.get("/api/tips", headers=authenticated_user["headers"])
-        # Should either succeed or fail gracefully, not crash
-        assert response.status_code in [
-            status.HTTP_200_OK,
-            status.HTTP_500_INTERNAL_SERVER_ERROR,
-            status.HTTP_503_SERVICE_UNAVAILABLE,
-        ]
+    async def test_database_timeout_returns_service_unavailable(
+        self, auth_client: httpx.AsyncClient
+    ):
+        """Test that a database timeout while loading the user is reported as 503."""
 
+        class TimedOutSession:
+            def query(self, *args, **kwargs):
+                raise TimeoutError("database timed out")
 
-class TestProtectedEndpointPerformance:
-    """Tests for performance characteristics of protected endpoints."""
+        def override_get_db():
+            yield TimedOutSession()
 
-    def test_authentication_overhead_minimal(
-        self, test_client: TestClient, authenticated_user, sample_tips
-    ):
-        """Test that authentication doesn't add significant overhead."""
-        import time
+        # The async_client fixture clears dependency overrides on teardown
+        app.dependency_overrides[get_db] = override_get_db
 
-        # Measure time for authenticated request
-        start_time = time.time()
-        response = test_client.get("/api/tips", headers=authenticated_user["headers"])
-        auth_time = time.time() - start_time
+        response = await auth_client.get("/api/tips")
 
-        assert response.status_code == status.HTTP_200_OK
-        # Authentication should complete within reasonable time (1 second)
-        assert auth_time < 1.0
+        assert response.status_code == status.HTTP_503_SERVICE_UNAVAILABLE
+        # The internal error text is not exposed to the client
+        assert "timed out" not in response.json()["detail"]
 
-    def test_concurrent_authenticated_requests(
-        self, test_client: TestClient, authenticated_user, sample_tips
-    ):
-        """Test that multiple authenticated requests work correctly under load."""
-        import time
 
-        # Instead of true concurrency (which causes SQLite issues in tests),
-        # test rapid sequential requests to verify authentication performance
-        responses = []
-        start_time = time.time()
+class TestProtectedEndpointPerformance:
+    """Tests for performance characteristics of protected endpoints."""
 
-        # Make 5 rapid sequential requests
+    async def test_concurrent_authenticated_requests(
+        self, auth_client: httpx.AsyncClient, sample_tips
+    ):
+        """Test that repeated authenticated requests all succeed."""
+        # Issued one after another: every request shares the test's database
+        # session, and a Session must not be used from several threads at once
         for _ in range(5):
-            response = test_client.get("/api/tips", headers=authenticated_user["headers"])
-            responses.append(response)
-
-        end_time = time.time()
-        total_time = end_time - start_time
+            response = await auth_client.get("/api/tips")
 
-        # All requests should succeed
-        for response in responses:
             assert response.status_code == status.HTTP_200_OK
             data = response.json()
             assert "tips" in data
             assert "total" in data
 
-        # Requests should complete reasonably quickly (less than 2 seconds for 5 requests)
-        assert total_time < 2.0, f"5 requests took {total_time:.2f}s, should be under 2s"
-
 
 class TestProtectedEndpointTokenValidation:
     """Tests for comprehensive token validation scenarios."""
 
-    def test_valid_token_with_different_users(self, test_client: TestClient, sample_tips):
+    async def test_valid_token_with_different_users(
+        self, async_client: httpx.AsyncClient, two_authenticated_users
+    ):
         """Test that valid tokens work for different users."""
-        # Create two different users
-        user1_data = {
-            "email": "user1_token@example.com",
-            "password": "SecurePassword123!",
-            "name": "User 1",
-        }
-        user2_data = {
-            "email": "user2_token@example.com",
-            "password": "SecurePassword123!",
-            "name": "User 2",
-        }
-
-        # Register both users
-        test_client.post("/auth/register", json=user1_data)
-        test_client.post("/auth/register", json=user2_data)
-
-        # Login both users
-        login1 = test_client.post(
-            "/auth/login", json={"email": user1_data["email"], "password": user1_data["password"]}
-        )
-        login2 = test_client.post(
-            "/auth/login", json={"email": user2_data["email"], "password": user2_data["password"]}
-        )
-
-        assert login1.status_code == status.HTTP_200_OK
-        assert login2.status_code == status.HTTP_200_OK
-
-        tokens1 = login1.json()
-        tokens2 = login2.json()
+        user1, user2 = two_authenticated_users
 
         # Both tokens should work for protected endpoints
-        headers1 = {"Authorization": f"Bearer {tokens1['access_token']}"}
-        headers2 = {"Authorization": f"Bearer {tokens2['access_token']}"}
-
-        response1 = test_client.get("/api/tips", headers=headers1)
-        response2 = test_client.get("/api/tips", headers=headers2)
+        response1 = await async_client.get("/api/tips", headers=user1["headers"])
+        response2 = await async_client.get("/api/tips", headers=user2["headers"])
 
         assert response1.status_code == status.HTTP_200_OK
         assert response2.status_code == status.HTTP_200_OK
@@ -715,12 +587,10 @@ class TestProtectedEndpointTokenValidation:
         data2 = response2.json()
         assert data1["user_id"] != data2["user_id"]
 
-    def test_token_reuse_across_endpoints(
-        self, test_client: TestClient, authenticated_user, sample_tips, sample_market_data
+    async def test_token_reuse_across_endpoints(
+        self, auth_client: httpx.AsyncClient, sample_tips, sample_market_data
     ):
         """Test that a single token can be reused across multiple protected endpoints."""
-        headers = authenticated_user["headers"]
-
         # Test multiple endpoints with same token
         endpoints = [
             ("/api/tips", "GET"),
@@ -731,11 +601,13 @@ class TestProtectedEndpointTokenValidation:
 
         for endpoint, method in endpoints:
             if method == "GET":
-                response = test_client.get(endpoint, headers=headers)
+                response = await auth_client.get(endpoint)
 
             assert response.status_code == status.HTTP_200_OK, f"Token should work for {endpoint}"
 
-    def test_refresh_token_cannot_access_protected_endpoints(self, test_client: TestClient):
+    async def test_refresh_token_cannot_access_protected_endpoints(
+        self, async_client: httpx.AsyncClient
+    ):
         """Test that refresh tokens cannot be used to access protected endpoints."""
         # Register and login to get tokens
         user_data = {
@@ -743,15 +615,15 @@ class TestProtectedEndpointTokenValidation:
             "password": "SecurePassword123!",
             "name": "Refresh Test User",
         }
-        test_client.post("/auth/register", json=user_data)
-        login_response = test_client.post(
+        await async_client.post("/auth/register", json=user_data)
+        login_response = await async_client.post(
             "/auth/login", json={"email": user_data["email"], "password": user_data["password"]}
         )
         tokens = login_response.json()
 
         # Try to use refresh token for protected endpoint
         headers = {"Authorization": f"Bearer {tokens['refresh_token']}"}
-        response = test_client.get("/api/tips", headers=headers)
+        response = await async_client.get("/api/tips", headers=headers)
 
         assert response.status_code == status.HTTP_401_UNAUTHORIZED
         response_data = response.json()
@@ -762,84 +634,37 @@ class TestProtectedEndpointTokenValidation:
 class TestProtectedEndpointDataIsolation:
     """Tests to ensure users can only access their own data."""
 
-    def test_user_profile_data_isolation(self, test_client: TestClient):
+    async def test_user_profile_data_isolation(
+        self, async_client: httpx.AsyncClient, two_authenticated_users
+    ):
         """Test that users can only access their own profile data."""
-        # Create two users
-        user1_data = {
-            "email": "isolation1@example.com",
-            "password": "SecurePassword123!",
-            "name": "User 1",
-        }
-        user2_data = {
-            "email": "isolation2@example.com",
-            "password": "SecurePassword123!",
-            "name": "User 2",
-        }
-
-        # Register users
-        reg1 = test_client.post("/auth/register", json=user1_data)
-        reg2 = test_client.post("/auth/register", json=user2_data)
-        _user1_id = reg1.json()["id"]
-        _user2_id = reg2.json()["id"]
-
-        # Login users
-        login1 = test_client.post(
-            "/auth/login", json={"email": user1_data["email"], "password": user1_data["password"]}
-        )
-        login2 = test_client.post(
-            "/auth/login", json={"email": user2_data["email"], "password": user2_data["password"]}
-        )
-
-        headers1 = {"Authorization": f"Bearer {login1.json()['access_token']}"}
-        headers2 = {"Authorization": f"Bearer {login2.json()['access_token']}"}
+        user1, user2 = two_authenticated_users
 
         # User 1 should access their own profile
-        response1 = test_client.get("/api/user/profile", headers=headers1)
+        response1 = await async_client.get("/api/user/profile", headers=user1["headers"])
         assert response1.status_code == status.HTTP_200_OK
         profile1 = response1.json()
-        assert profile1["email"] == user1_data["email"]
+        assert profile1["email"] == user1["user"]["email"]
 
         # User 2 should access their own profile
-        response2 = test_client.get("/api/user/profile", headers=headers2)
+        response2 = await async_client.get("/api/user/profile", headers=user2["headers"])
         assert response2.status_code == status.HTTP_200_OK
         profile2 = response2.json()
-        assert profile2["email"] == user2_data["email"]
+        assert profile2["email"] == user2["user"]["email"]
 
         # Profiles should be different
         assert profile1["id"] != profile2["id"]
         assert profile1["email"] != profile2["email"]
 
-    def test_tips_data_context_per_user(self, test_client: TestClient, sample_tips):
+    async def test_tips_data_context_per_user(
+        self, async_client: httpx.AsyncClient, two_authenticated_users
+    ):
         """Test that tips endpoint provides correct user context for different users."""
-        # Create two users
-        user1_data = {
-            "email": "tips1@example.com",
-            "password": "SecurePassword123!",
-            "name": "Tips User 1",
-        }
-        user2_data = {
-            "email": "tips2@example.com",
-            "password": "SecurePassword123!",
-            "name": "Tips User 2",
-        }
-
-        # Register and login users
-        reg1 = test_client.post("/auth/register", json=user1_data)
-        reg2 = test_client.post("/auth/register", json=user2_data)
-
-        login1 = test_client.post(
-            "/auth/login", json={"email": user1_data["email"], "password": user1_data["password"]}
-        )
-        login2 = test_client.post(
-            "/auth/login", json={"email": user2_data["email"], "password": user2_data["password"]}
-        )
-
-        headers1 = {"Authorization": f"Bearer {login1.json()['access_token']}"}
-        headers2 = {"Authorization": f"Bearer {login2.json()['access_token']}"}
+        user1, user2 = two_authenticated_users
 
         # Both users should get tips but with their own user context
-        response1 = test_client.get("/api/tips", headers=headers1)
-        response2 = test_client.get("/api/tips", headers=headers2)
+        response1 = await async_client.get("/api/tips", headers=user1["headers"])
+        response2 = await async_client.get("/api/tips", headers=user2["headers"])
 
         assert response1.status_code == status.HTTP_200_OK
         assert response2.status_code == status.HTTP_200_OK
@@ -849,5 +674,5 @@ class TestProtectedEndpointDataIsolation:
 
         # User contexts should be different
         assert data1["user_id"] != data2["user_id"]
-        assert data1["user_id"] == reg1.json()["id"]
-        assert data2["user_id"] == reg2.json()["id"]
+        assert data1["user_id"] == user1["user"]["id"]
+        assert data2["user_id"] == user2["user"]["id"]
@@ -2,7 +2,20 @@
 
 import time
 
-from src.services.rate_limiter import RateLimiter
+from src.services.rate_limiter import NS_PER_SECOND, RateLimiter
+
+
+class FakeClock:
+    """A manually advanced monotonic clock for driving RateLimiter without sleeping."""
+
+    def __init__(self):
+        self.now_ns = 0
+
+    def __call__(self) -> int:
+        return self.now_ns
+
+    def advance(self, seconds: float) -> None:
+        self.now_ns += int(seconds * NS_PER_SECOND)
 
 
 class TestRateLimiterUnitTests:
@@ -40,7 +53,8 @@ class TestRateLimiterUnitTests:
 
     def test_rate_limiter_resets_after_window(self):
         """Test that rate limiter resets after the time window."""
-        rate_limiter = RateLimiter()
+        clock = FakeClock()
+        rate_limiter = RateLimiter(clock=clock)
         client_id = "test_client"
         limit = 2
         window = 1
@@ -55,7 +69,7 @@ class TestRateLimiterUnitTests:
         assert allowed3 is False
 
         # Wait for window to reset
-        time.sleep(1.1)
+        clock.advance(1.1)
 
         # Should be allowed again
         allowed4, _ = rate_limiter.is_allowed(client_id, limit, window)
@@ -190,7 +204,6 @@ class TestRateLimiterUnitTests:
         # Check stats
         stats = rate_limiter.get_stats(client_id)
         assert stats["current_requests"] == 2
-        assert len(stats["request_timestamps"]) == 2
 
     def test_rate_limiter_with_zero_limit(self):
         """Test rate limiter with zero limit blocks all requests."""
@@ -243,3 +256,64 @@ class TestRateLimiterUnitTests:
         assert allowed2 is False
         assert "retry_after" in info
         assert info["retry_after"] > 0
+
+    def test_rate_limiter_sweep_drops_refilled_buckets(self):
+        """Test that sweeping forgets idle clients but keeps ones still limited."""
+        clock = FakeClock()
+        rate_limiter = RateLimiter(clock=clock)
+        rate_limiter.is_allowed("idle_client", 1, 1)
+        rate_limiter.is_allowed("active_client", 1, 60)
+
+        clock.advance(1.1)
+
+        assert rate_limiter.sweep() == 1
+        assert rate_limiter.get_stats("idle_client")["current_requests"] == 0
+        assert rate_limiter.get_stats("active_client")["current_requests"] == 1
+
+    def test_rate_limiter_sweeps_periodically(self, monkeypatch):
+        """Test that is_allowed sweeps refilled buckets every SWEEP_INTERVAL calls."""
+        clock = FakeClock()
+        rate_limiter = RateLimiter(clock=clock)
+        monkeypatch.setattr(RateLimiter, "SWEEP_INTERVAL", 3)
+        rate_limiter.is_allowed("idle_client", 1, 1)
+
+        clock.advance(1.1)
+        rate_limiter.is_allowed("client", 5, 60)
+        rate_limiter.is_allowed("client", 5, 60)
+
+        assert rate_limiter.get_stats("idle_client")["current_requests"] == 0
+
+    def test_rate_limiter_blocked_checks_are_cached(self):
+        """Test that repeat checks while blocked skip the bucket and keep their info."""
+        rate_limiter = RateLimiter()
+        rate_limiter.is_allowed("test_client", 1, 60)
+        allowed1, info1 = rate_limiter.is_allowed("test_client", 1, 60)
+
+        # Drop the bucket behind the cache's back; only the negative cache answers
+        shard = rate_limiter._shard("test_client")
+        shard.buckets.clear()
+        allowed2, info2 = rate_limiter.is_allowed("test_client", 1, 60)
+
+        assert allowed1 is False
+        assert allowed2 is False
+        assert info2["reset_time"] == info1["reset_time"]
+        assert 0 < info2["retry_after"] <= info1["retry_after"]
+
+    def test_rate_limiter_blocked_cache_is_per_limit(self):
+        """Test that a block under one limit does not block a larger limit on the same key."""
+        rate_limiter = RateLimiter()
+        rate_limiter.is_allowed("ip:shared", 1, 60)
+
+        assert rate_limiter.is_allowed("ip:shared", 1, 60)[0] is False
+        assert rate_limiter.is_allowed("ip:shared", 5, 60)[0] is True
+
+    def test_rate_limiter_clear_key_drops_blocked_cache(self):
+        """Test that clearing a key also forgets that it was blocked."""
+        rate_limiter = RateLimiter()
+        rate_limiter.is_allowed("test_client", 1, 60)
+        rate_limiter.is_allowed("test_client", 1, 60)
+
+        rate_limiter.clear_key("test_client")
+
+        allowed, _ = rate_limiter.is_allowed("test_client", 1, 60)
+        assert allowed is True
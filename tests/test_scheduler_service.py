@@ -1,13 +1,11 @@
 """Tests for scheduler service."""
 
-import json
-import sys
 from datetime import datetime
-from io import StringIO
-from unittest.mock import Mock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
-from hypothesis import HealthCheck, given, settings
+from apscheduler.schedulers.base import BaseScheduler
+from hypothesis import given, settings
 from hypothesis import strategies as st
 
 from src.models.market_data import DataSource, HistoricalData, MarketData
@@ -17,6 +15,47 @@ from src.services.email_service import EmailService
 from src.services.market_data_aggregator import MarketDataAggregator
 from src.services.scheduler_service import SchedulerService
 from src.utils.logger import StructuredLogger
+from src.utils.trace_context import clear_trace, create_trace
+
+# Price history and source shared by every generated MarketData; the properties
+# under test only depend on the scalar fields, so only those are drawn. Thirty
+# prices cover the 26 that MACD needs.
+_BASE_HISTORICAL_DATA = HistoricalData(
+    period="24h",
+    prices=[100.0 + (i % 7) * 1.5 for i in range(30)],
+    timestamps=[float(i) for i in range(30)],
+)
+_BASE_SOURCE = DataSource(
+    name="CoinGecko", url="https://coingecko.com", fetched_at=datetime(2024, 1, 1)
+)
+
+# Fixed delivery inputs for test_execute_delivery_with_mocked_services
+_MOCK_MARKET_DATA = MarketData(
+    symbol="BTC",
+    type="crypto",
+    current_price=50000.0,
+    price_change_24h=5.0,
+    volume_24h=1000000.0,
+    historical_data=HistoricalData(
+        period="24h",
+        prices=[49000.0 + i * 100 for i in range(30)],
+        timestamps=[float(i) for i in range(30)],
+    ),
+    source=_BASE_SOURCE,
+)
+_MOCK_TIP = TradingTip(
+    symbol="BTC",
+    type="crypto",
+    recommendation="BUY",
+    reasoning="Strong upward momentum",
+    confidence=75,
+    indicators=["RSI", "SMA"],
+    sources=[TipSource(name="CoinGecko", url="https://coingecko.com")],
+)
+
+# Symbols are only compared for equality, so printable ASCII is enough and keeps
+# Hypothesis from sampling the whole Unicode range
+_SYMBOL_ALPHABET = st.characters(min_codepoint=32, max_codepoint=126)
 
 
 # Strategies for generating test data
@@ -30,10 +69,8 @@ def valid_time_strategy(draw):
 
 @st.composite
 def market_data_strategy(draw, asset_type=None):
-    """Generate valid MarketData objects."""
-    symbol = draw(
-        st.text(min_size=1, max_size=10, alphabet=st.characters(blacklist_characters="\x00"))
-    )
+    """Generate valid MarketData objects around the shared price history and source."""
+    symbol = draw(st.text(min_size=1, max_size=10, alphabet=_SYMBOL_ALPHABET))
     if asset_type is None:
         data_type = draw(st.sampled_from(["crypto", "stock"]))
     else:
@@ -49,50 +86,139 @@ def market_data_strategy(draw, asset_type=None):
         st.floats(min_value=0, max_value=1000000000, allow_nan=False, allow_infinity=False)
     )
 
-    # Generate historical data with at least 26 prices for MACD calculation
-    prices = draw(
-        st.lists(
-            st.floats(min_value=0.01, max_value=1000000, allow_nan=False, allow_infinity=False),
-            min_size=26,
-            max_size=100,
-        )
-    )
-    timestamps = draw(
-        st.lists(
-            st.floats(min_value=0, allow_nan=False, allow_infinity=False),
-            min_size=len(prices),
-            max_size=len(prices),
-        )
-    )
-
-    period = draw(st.sampled_from(["24h", "7d", "30d"]))
-
-    historical = HistoricalData(period=period, prices=prices, timestamps=timestamps)
-
-    source = DataSource(
-        name=draw(
-            st.text(min_size=1, max_size=50, alphabet=st.characters(blacklist_characters="\x00"))
-        ),
-        url=draw(
-            st.text(min_size=1, max_size=100, alphabet=st.characters(blacklist_characters="\x00"))
-        ),
-        fetched_at=datetime.now(),
-    )
-
     return MarketData(
         symbol=symbol,
         type=data_type,
         current_price=current_price,
         price_change_24h=price_change,
         volume_24h=volume,
-        historical_data=historical,
-        source=source,
+        historical_data=_BASE_HISTORICAL_DATA,
+        source=_BASE_SOURCE,
     )
 
 
+# Spec'd stand-ins for the delivery collaborators, built once; spec'ing a
+# MagicMock introspects the class, so it is not repeated per Hypothesis example
+_MARKET_MOCK = MagicMock(spec=MarketDataAggregator)
+_ANALYSIS_MOCK = MagicMock(spec=AnalysisEngine)
+_EMAIL_MOCK = MagicMock(spec=EmailService)
+
+# CoinGecko response for the fetch logging property; examples only swap the payload
+_COINGECKO_RESPONSE = Mock()
+_COINGECKO_RESPONSE.raise_for_status.return_value = None
+
+
+def _install_delivery_mocks(scheduler, crypto_data, crypto_tips):
+    """
+    Swap the scheduler's delivery collaborators for the shared mocks by plain assignment.
+
+    Crypto fetch and analysis return the given data and tips, stock fetch and
+    analysis return nothing, and sending succeeds. Calls recorded by earlier
+    tests are cleared first.
+
+    Returns:
+        A callable that puts the original services back
+    """
+    originals = (scheduler.market_aggregator, scheduler.analysis_engine, scheduler.email_service)
+
+    for mock in (_MARKET_MOCK, _ANALYSIS_MOCK, _EMAIL_MOCK):
+        mock.reset_mock()
+    _MARKET_MOCK.fetch_crypto_data.return_value = crypto_data
+    _MARKET_MOCK.fetch_stock_data.return_value = []
+    _ANALYSIS_MOCK.analyze_crypto.return_value = crypto_tips
+    _ANALYSIS_MOCK.analyze_stocks.return_value = []
+    _EMAIL_MOCK.send_email_content.return_value = True
+    scheduler.market_aggregator = _MARKET_MOCK
+    scheduler.analysis_engine = _ANALYSIS_MOCK
+    scheduler.email_service = _EMAIL_MOCK
+
+    def restore():
+        (
+            scheduler.market_aggregator,
+            scheduler.analysis_engine,
+            scheduler.email_service,
+        ) = originals
+
+    return restore
+
+
+class RecordingLogger(StructuredLogger):
+    """A StructuredLogger that keeps entries as dicts in memory instead of printing JSON."""
+
+    def __init__(self, component: str):
+        super().__init__(component)
+        self.records: list[dict] = []
+
+    def _format_log_entry(self, level, message, context=None, exception=None):
+        return self._build_log_entry(level, message, context, exception)
+
+    def _write_log(self, log_entry):
+        self.records.append(log_entry)
+
+
+class ThreadlessScheduler(BaseScheduler):
+    """An APScheduler that registers jobs but never starts a thread to run them."""
+
+    # BaseScheduler declares both abstract; there is no thread to wake or join
+    def wakeup(self):
+        pass
+
+    def shutdown(self, wait=True):
+        super().shutdown(wait)
+
+
+@pytest.fixture(scope="class")
+def scheduler():
+    """A SchedulerService shared by the tests in a class; tests reset the jobs they check."""
+    service = SchedulerService(scheduler=ThreadlessScheduler())
+    yield service
+    service.stop()
+
+
+@pytest.fixture(scope="class")
+def scheduler_with_events():
+    """A shared SchedulerService wired to an EventStore, kept apart from ``scheduler``."""
+    from src.utils.event_store import EventStore
+
+    service = SchedulerService(event_store=EventStore(), scheduler=ThreadlessScheduler())
+    yield service
+    service.stop()
+
+
+@pytest.fixture(scope="class")
+def aggregator():
+    """A MarketDataAggregator recording its logs, shared across Hypothesis examples."""
+    service = MarketDataAggregator()
+    service.logger = RecordingLogger("MarketDataAggregator")
+    return service
+
+
+@pytest.fixture(scope="class")
+def analysis_engine():
+    """An AnalysisEngine recording its logs, shared across Hypothesis examples."""
+    service = AnalysisEngine()
+    service.logger = RecordingLogger("AnalysisEngine")
+    return service
+
+
+@pytest.fixture(scope="class")
+def email_service():
+    """An EmailService recording its logs, shared across Hypothesis examples."""
+    service = EmailService()
+    service.logger = RecordingLogger("email_service")
+    return service
+
+
 class TestSchedulerService:
     """Test suite for SchedulerService."""
 
+    @pytest.fixture(autouse=True)
+    def _trace(self):
+        """Run each test inside a fresh trace, cleared afterwards."""
+        create_trace()
+        yield
+        clear_trace()
+
     def test_scheduler_initialization(self):
         """Test that scheduler initializes correctly."""
         scheduler = SchedulerService()
@@ -100,34 +226,32 @@ class TestSchedulerService:
         assert scheduler.is_running is False
         assert scheduler.scheduler is not None
 
-    def test_validate_time_format_valid(self):
+    @pytest.mark.parametrize("time_str", ["06:00", "18:30", "00:00", "23:59"])
+    def test_validate_time_format_valid(self, scheduler, time_str):
         """Test that valid time formats are accepted."""
-        scheduler = SchedulerService()
         # Should not raise
-        scheduler._validate_time_format("06:00")
-        scheduler._validate_time_format("18:30")
-        scheduler._validate_time_format("00:00")
-        scheduler._validate_time_format("23:59")
-
-    def test_validate_time_format_invalid(self):
+        scheduler._validate_time_format(time_str)
+
+    @pytest.mark.parametrize(
+        "time_str",
+        [
+            pytest.param("25:00", id="invalid-hour"),
+            pytest.param("12:60", id="invalid-minute"),
+            pytest.param("12", id="missing-minute"),
+            pytest.param("12:30:45", id="too-many-parts"),
+            pytest.param("ab:cd", id="not-numbers"),
+            pytest.param(None, id="none"),
+            pytest.param(["06", "00"], id="unhashable"),
+        ],
+    )
+    def test_validate_time_format_invalid(self, scheduler, time_str):
         """Test that invalid time formats are rejected."""
-        scheduler = SchedulerService()
-
-        with pytest.raises(ValueError):  # noqa: PT011
-            scheduler._validate_time_format("25:00")  # Invalid hour
-
-        with pytest.raises(ValueError):  # noqa: PT011
-            scheduler._validate_time_format("12:60")  # Invalid minute
-
-        with pytest.raises(ValueError):  # noqa: PT011
-            scheduler._validate_time_format("12")  # Missing minute
-
-        with pytest.raises(ValueError):  # noqa: PT011
-            scheduler._validate_time_format("12:30:45")  # Too many parts
+        with pytest.raises(ValueError, match="Invalid time"):
+            scheduler._validate_time_format(time_str)
 
     @given(valid_time_strategy(), valid_time_strategy())
-    @settings(max_examples=50)
-    def test_scheduled_delivery_execution(self, morning_time, evening_time):
+    @settings(deadline=None)
+    def test_scheduled_delivery_execution(self, scheduler, morning_time, evening_time):
         """
         **Feature: daily-market-tips, Property 6: Email delivery executes on schedule**
 
@@ -136,7 +260,7 @@ class TestSchedulerService:
 
         **Validates: Requirements 3.2**
         """
-        scheduler = SchedulerService()
+        scheduler.scheduler.remove_all_jobs()
 
         # Schedule deliveries
         scheduler.schedule_deliveries(morning_time, evening_time)
@@ -158,81 +282,44 @@ class TestSchedulerService:
         assert evening_job is not None, "Evening delivery job must be registered"
         assert evening_job.name == "Evening Market Tips Delivery"
 
-        # Cleanup
-        scheduler.stop()
-
-    def test_execute_delivery_with_mocked_services(self):
+    def test_execute_delivery_with_mocked_services(self, scheduler):
         """Test that execute_delivery orchestrates the full flow."""
-        scheduler = SchedulerService()
+        # Swap in mocks; restoring them keeps the shared scheduler reusable
+        restore = _install_delivery_mocks(scheduler, [_MOCK_MARKET_DATA], [_MOCK_TIP])
+        try:
+            mock_send = scheduler.email_service.send_email_content
 
-        # Mock the services
-        mock_market_data = MarketData(
-            symbol="BTC",
-            type="crypto",
-            current_price=50000.0,
-            price_change_24h=5.0,
-            volume_24h=1000000.0,
-            historical_data=HistoricalData(
-                period="24h",
-                prices=[49000.0 + i * 100 for i in range(30)],
-                timestamps=[float(i) for i in range(30)],
-            ),
-            source=DataSource(
-                name="CoinGecko", url="https://coingecko.com", fetched_at=datetime.now()
-            ),
-        )
+            # Execute delivery
+            scheduler.execute_delivery("morning")
+        finally:
+            restore()
 
-        mock_tip = TradingTip(
-            symbol="BTC",
-            type="crypto",
-            recommendation="BUY",
-            reasoning="Strong upward momentum",
-            confidence=75,
-            indicators=["RSI", "SMA"],
-            sources=[TipSource(name="CoinGecko", url="https://coingecko.com")],
-        )
+        # Verify email was sent
+        assert mock_send.called, "Email service should be called"
+        call_args = mock_send.call_args[0][0]
+        assert isinstance(call_args, EmailContent)
+        assert call_args.delivery_type == "morning"
+        assert len(call_args.tips) > 0
+        assert len(call_args.market_data) > 0
 
-        with patch.object(
-            scheduler.market_aggregator, "fetch_crypto_data", return_value=[mock_market_data]
-        ):
-            with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
-                with patch.object(
-                    scheduler.analysis_engine, "analyze_crypto", return_value=[mock_tip]
-                ):
-                    with patch.object(scheduler.analysis_engine, "analyze_stocks", return_value=[]):
-                        with patch.object(
-                            scheduler.email_service, "send_email_content", return_value=True
-                        ) as mock_send:
-                            # Execute delivery
-                            scheduler.execute_delivery("morning")
-
-                            # Verify email was sent
-                            assert mock_send.called, "Email service should be called"
-                            call_args = mock_send.call_args[0][0]
-                            assert isinstance(call_args, EmailContent)
-                            assert call_args.delivery_type == "morning"
-                            assert len(call_args.tips) > 0
-                            assert len(call_args.market_data) > 0
-
-    def test_execute_delivery_invalid_type(self):
+    def test_execute_delivery_invalid_type(self, scheduler):
         """Test that invalid delivery type is handled gracefully."""
-        scheduler = SchedulerService()
 
         # Should not raise, just log error
         scheduler.execute_delivery("invalid")
 
     def test_scheduler_stop(self):
         """Test that scheduler can be stopped."""
-        scheduler = SchedulerService()
+        scheduler = SchedulerService(scheduler=ThreadlessScheduler())
         scheduler.schedule_deliveries("06:00", "18:00")
 
         assert scheduler.is_running is True
         scheduler.stop()
         assert scheduler.is_running is False
 
-    def test_schedule_deliveries_replaces_existing_jobs(self):
+    def test_schedule_deliveries_replaces_existing_jobs(self, scheduler):
         """Test that scheduling twice replaces existing jobs."""
-        scheduler = SchedulerService()
+        scheduler.scheduler.remove_all_jobs()
 
         # Schedule first time
         scheduler.schedule_deliveries("06:00", "18:00")
@@ -245,11 +332,8 @@ class TestSchedulerService:
         # Should have same number of jobs (replaced, not added)
         assert jobs_count_1 == jobs_count_2
 
-        scheduler.stop()
-
     @given(market_data_strategy(asset_type="crypto"))
-    @settings(max_examples=10, suppress_health_check=[HealthCheck.data_too_large])
-    def test_delivery_operations_are_logged(self, market_data):
+    def test_delivery_operations_are_logged(self, scheduler_with_events, market_data):
         """
         **Feature: observability-logging, Property 1: Delivery operations are logged**
         **Validates: Requirements 1.1**
@@ -257,71 +341,46 @@ class TestSchedulerService:
         For any delivery operation, the event store SHALL contain both a delivery_start
         and delivery_complete event with matching trace IDs.
         """
-        from src.utils.event_store import EventStore
-        from src.utils.trace_context import clear_trace, create_trace
+        scheduler = scheduler_with_events
+        event_store = scheduler.event_store
+        event_store.clear()
 
-        event_store = EventStore()
-        scheduler = SchedulerService(event_store=event_store)
-
-        # Create a trace for this test
-        create_trace()
+        mock_tip = TradingTip(
+            symbol=market_data.symbol,
+            type="crypto",
+            recommendation="BUY",
+            reasoning="Test recommendation",
+            confidence=75,
+            indicators=["RSI"],
+            sources=[TipSource(name="Test", url="https://test.com")],
+        )
 
+        # Mock the services to return our test data
+        restore = _install_delivery_mocks(scheduler, [market_data], [mock_tip])
         try:
-            # Mock the services to return our test data
-            with patch.object(
-                scheduler.market_aggregator, "fetch_crypto_data", return_value=[market_data]
-            ):
-                with patch.object(scheduler.market_aggregator, "fetch_stock_data", return_value=[]):
-                    mock_tip = TradingTip(
-                        symbol=market_data.symbol,
-                        type="crypto",
-                        recommendation="BUY",
-                        reasoning="Test recommendation",
-                        confidence=75,
-                        indicators=["RSI"],
-                        sources=[TipSource(name="Test", url="https://test.com")],
-                    )
-                    with patch.object(
-                        scheduler.analysis_engine, "analyze_crypto", return_value=[mock_tip]
-                    ):
-                        with patch.object(
-                            scheduler.analysis_engine, "analyze_stocks", return_value=[]
-                        ):
-                            with patch.object(
-                                scheduler.email_service, "send_email_content", return_value=True
-                            ):
-                                # Execute delivery
-                                scheduler.execute_delivery("morning")
-
-                                # Property: Event store should contain delivery_start event
-                                events = event_store.get_all_events()
-                                delivery_start_events = [
-                                    e for e in events if e.event_type == "delivery_start"
-                                ]
-                                assert len(delivery_start_events) > 0, (
-                                    "delivery_start event not found"
-                                )
-
-                                # Property: Event store should contain delivery_complete event
-                                delivery_complete_events = [
-                                    e for e in events if e.event_type == "delivery_complete"
-                                ]
-                                assert len(delivery_complete_events) > 0, (
-                                    "delivery_complete event not found"
-                                )
-
-                                # Property: Both events should have matching trace IDs
-                                start_trace = delivery_start_events[0].trace_id
-                                complete_trace = delivery_complete_events[0].trace_id
-                                assert start_trace == complete_trace, (
-                                    "Trace IDs don't match between start and complete events"
-                                )
+            # Execute delivery
+            scheduler.execute_delivery("morning")
+
+            # Property: Event store should contain delivery_start event
+            events = event_store.get_all_events()
+            delivery_start_events = [e for e in events if e.event_type == "delivery_start"]
+            assert len(delivery_start_events) > 0, "delivery_start event not found"
+
+            # Property: Event store should contain delivery_complete event
+            delivery_complete_events = [e for e in events if e.event_type == "delivery_complete"]
+            assert len(delivery_complete_events) > 0, "delivery_complete event not found"
+
+            # Property: Both events should have matching trace IDs
+            start_trace = delivery_start_events[0].trace_id
+            complete_trace = delivery_complete_events[0].trace_id
+            assert start_trace == complete_trace, (
+                "Trace IDs don't match between start and complete events"
+            )
         finally:
-            clear_trace()
+            restore()
 
     @given(market_data_strategy(asset_type="crypto"))
-    @settings(max_examples=10, suppress_health_check=[HealthCheck.data_too_large])
-    def test_fetch_operations_are_logged_with_required_fields(self, market_data):
+    def test_fetch_operations_are_logged_with_required_fields(self, aggregator, market_data):
         """
         **Feature: observability-logging, Property 2: Fetch operations are logged with required fields**
         **Validates: Requirements 1.2**
@@ -329,75 +388,52 @@ class TestSchedulerService:
         For any market data fetch operation, the log entry SHALL include source,
         symbols, and result (success/failure).
         """
-        from src.utils.trace_context import clear_trace, create_trace
+        logger = aggregator.logger
+        logger.records.clear()
+
+        # Mock the requests to return our test data
+        _COINGECKO_RESPONSE.json.return_value = {
+            market_data.symbol.lower(): {
+                "usd": market_data.current_price,
+                "usd_24h_change": market_data.price_change_24h,
+                "usd_24h_vol": market_data.volume_24h,
+            }
+        }
+        with patch(
+            "src.services.market_data_aggregator.requests.get",
+            return_value=_COINGECKO_RESPONSE,
+        ):
+            # Fetch crypto data
+            aggregator.fetch_crypto_data([market_data.symbol])
 
-        create_trace()
+        log_entries = logger.records
 
-        try:
-            aggregator = MarketDataAggregator()
-
-            # Mock the requests to return our test data
-            with patch("src.services.market_data_aggregator.requests.get") as mock_get:
-                mock_response = Mock()
-                mock_response.json.return_value = {
-                    market_data.symbol.lower(): {
-                        "usd": market_data.current_price,
-                        "usd_24h_change": market_data.price_change_24h,
-                        "usd_24h_vol": market_data.volume_24h,
-                    }
-                }
-                mock_response.raise_for_status.return_value = None
-                mock_get.return_value = mock_response
-
-                # Capture logs
-                captured_output = StringIO()
-                original_stdout = sys.stdout
-                sys.stdout = captured_output
-
-                try:
-                    # Fetch crypto data
-                    aggregator.fetch_crypto_data([market_data.symbol])
-
-                    # Restore stdout
-                    sys.stdout = original_stdout
-                    output = captured_output.getvalue()
-
-                    # Parse log entries
-                    log_lines = output.strip().split("\n")
-                    log_entries = [json.loads(line) for line in log_lines if line.strip()]
-
-                    # Property: At least one log entry should exist
-                    assert len(log_entries) > 0, "No log entries found"
-
-                    # Property: Log entries should include source and symbol
-                    source_logs = [e for e in log_entries if "source" in e.get("context", {})]
-                    assert len(source_logs) > 0, "No logs with source field found"
-
-                    for log_entry in source_logs:
-                        context = log_entry.get("context", {})
-                        assert "source" in context, "Missing 'source' field in context"
-                        assert "symbol" in context, "Missing 'symbol' field in context"
-
-                    # Property: At least one log entry should have a result field
-                    result_logs = [e for e in log_entries if "result" in e.get("context", {})]
-                    assert len(result_logs) > 0, "No logs with result field found"
-
-                    for log_entry in result_logs:
-                        context = log_entry.get("context", {})
-                        assert context["result"] in [
-                            "success",
-                            "failed",
-                            "not_found",
-                        ], "Invalid result value"
-
-                finally:
-                    sys.stdout = original_stdout
-        finally:
-            clear_trace()
+        # Property: At least one log entry should exist
+        assert len(log_entries) > 0, "No log entries found"
+
+        # Property: Log entries should include source and symbol
+        source_logs = [e for e in log_entries if "source" in e.get("context", {})]
+        assert len(source_logs) > 0, "No logs with source field found"
+
+        for log_entry in source_logs:
+            context = log_entry.get("context", {})
+            assert "source" in context, "Missing 'source' field in context"
+            assert "symbol" in context, "Missing 'symbol' field in context"
+
+        # Property: At least one log entry should have a result field
+        result_logs = [e for e in log_entries if "result" in e.get("context", {})]
+        assert len(result_logs) > 0, "No logs with result field found"
+
+        for log_entry in result_logs:
+            context = log_entry.get("context", {})
+            assert context["result"] in [
+                "success",
+                "failed",
+                "not_found",
+            ], "Invalid result value"
 
     @given(market_data_strategy(asset_type="crypto"))
-    @settings(max_examples=10, suppress_health_check=[HealthCheck.data_too_large])
-    def test_analysis_operations_are_logged_with_indicators(self, market_data):
+    def test_analysis_operations_are_logged_with_indicators(self, analysis_engine, market_data):
         """
         **Feature: observability-logging, Property 3: Analysis operations are logged with indicators**
         **Validates: Requirements 1.3**
@@ -405,55 +441,29 @@ class TestSchedulerService:
         For any analysis operation, the log entry SHALL include the indicators
         calculated and the resulting recommendation.
         """
-        from src.utils.trace_context import clear_trace, create_trace
-
-        create_trace()
-
-        try:
-            engine = AnalysisEngine()
-
-            # Capture logs
-            captured_output = StringIO()
-            original_stdout = sys.stdout
-            sys.stdout = captured_output
-
-            try:
-                # Analyze crypto data
-                engine.analyze_crypto([market_data])
-
-                # Restore stdout
-                sys.stdout = original_stdout
-                output = captured_output.getvalue()
-
-                # Parse log entries
-                log_lines = output.strip().split("\n")
-                log_entries = [json.loads(line) for line in log_lines if line.strip()]
-
-                # Property: Log entries should include indicators and recommendation
-                analysis_logs = [e for e in log_entries if "indicators" in e.get("context", {})]
-                assert len(analysis_logs) > 0, "No logs with indicators found"
-
-                for log_entry in analysis_logs:
-                    context = log_entry.get("context", {})
-                    if "indicators" in context:
-                        assert isinstance(context["indicators"], list), (
-                            "Indicators should be a list"
-                        )
-                        if "recommendation" in context:
-                            assert context["recommendation"] in [
-                                "BUY",
-                                "SELL",
-                                "HOLD",
-                            ], "Invalid recommendation"
-
-            finally:
-                sys.stdout = original_stdout
-        finally:
-            clear_trace()
-
-    @given(st.text(min_size=1, max_size=100))
-    @settings(max_examples=20)
-    def test_email_operations_are_logged_with_required_fields(self, recipient):
+        logger = analysis_engine.logger
+        logger.records.clear()
+
+        # Analyze crypto data
+        analysis_engine.analyze_crypto([market_data])
+
+        # Property: Log entries should include indicators and recommendation
+        analysis_logs = [e for e in logger.records if "indicators" in e.get("context", {})]
+        assert len(analysis_logs) > 0, "No logs with indicators found"
+
+        for log_entry in analysis_logs:
+            context = log_entry.get("context", {})
+            if "indicators" in context:
+                assert isinstance(context["indicators"], list), "Indicators should be a list"
+                if "recommendation" in context:
+                    assert context["recommendation"] in [
+                        "BUY",
+                        "SELL",
+                        "HOLD",
+                    ], "Invalid recommendation"
+
+    @given(st.from_regex(r"[A-Za-z0-9@._-]{1,100}", fullmatch=True))
+    def test_email_operations_are_logged_with_required_fields(self, email_service, recipient):
         """
         **Feature: observability-logging, Property 4: Email operations are logged with required fields**
         **Validates: Requirements 1.4**
@@ -461,54 +471,37 @@ class TestSchedulerService:
         For any email send operation, the log entry SHALL include recipient,
         subject, and delivery status.
         """
-        from src.utils.trace_context import clear_trace, create_trace
-
-        create_trace()
-
-        try:
-            email_service = EmailService()
-
-            # Capture logs
-            captured_output = StringIO()
-            original_stdout = sys.stdout
-            sys.stdout = captured_output
-
-            try:
-                # Mock requests.post to prevent actual email sending
-                with patch("src.services.email_service.requests.post") as mock_post:
-                    mock_response = Mock()
-                    mock_response.status_code = 200
-                    mock_post.return_value = mock_response
-
-                    # Send email
-                    email_service.send_email(recipient, "Test Subject", "Test Content")
-
-                    # Restore stdout
-                    sys.stdout = original_stdout
-                    output = captured_output.getvalue()
-
-                    # Parse log entries
-                    log_lines = output.strip().split("\n")
-                    log_entries = [json.loads(line) for line in log_lines if line.strip()]
-
-                    # Property: Log entries should include recipient, subject, and delivery_type
-                    email_logs = [e for e in log_entries if "recipient" in e.get("context", {})]
-                    assert len(email_logs) > 0, "No logs with recipient found"
-
-                    for log_entry in email_logs:
-                        context = log_entry.get("context", {})
-                        assert "recipient" in context, "Missing 'recipient' field"
-                        assert "subject" in context, "Missing 'subject' field"
-                        assert context["recipient"] == recipient
-                        assert context["subject"] == "Test Subject"
-
-            finally:
-                sys.stdout = original_stdout
-        finally:
-            clear_trace()
-
-    @given(st.text(min_size=1, max_size=100))
-    @settings(max_examples=20)
+        logger = email_service.logger
+        logger.records.clear()
+
+        # Mock requests.post to prevent actual email sending
+        with patch("src.services.email_service.requests.post") as mock_post:
+            mock_response = Mock()
+            mock_response.status_code = 200
+            mock_post.return_value = mock_response
+
+            # Send email
+            email_service.send_email(recipient, "Test Subject", "Test Content")
+
+        # Property: Log entries should include recipient, subject, and delivery_type
+        email_logs = [e for e in logger.records if "recipient" in e.get("context", {})]
+        assert len(email_logs) > 0, "No logs with recipient found"
+
+        for log_entry in email_logs:
+            context = log_entry.get("context", {})
+            assert "recipient" in context, "Missing 'recipient' field"
+            assert "subject" in context, "Missing 'subject' field"
+            assert context["recipient"] == recipient
+            assert context["subject"] == "Test Subject"
+
+    @pytest.mark.parametrize(
+        "error_message",
+        [
+            pytest.param("a", id="single-char"),
+            pytest.param("x" * 100, id="long"),
+            pytest.param("unicode: ñ ✓", id="unicode"),
+        ],
+    )
     def test_error_logging_includes_full_context(self, error_message):
         """
         **Feature: observability-logging, Property 5: Error logging includes full context**
@@ -517,43 +510,22 @@ class TestSchedulerService:
         For any error that occurs, the error log entry SHALL include exception type,
         message, and stack trace.
         """
-        from src.utils.trace_context import clear_trace, create_trace
-
-        create_trace()
+        logger = RecordingLogger("test_component")
 
+        # Create and log an exception
         try:
-            # Capture logs
-            captured_output = StringIO()
-            original_stdout = sys.stdout
-            sys.stdout = captured_output
-
-            try:
-                logger = StructuredLogger("test_component")
-
-                # Create and log an exception
-                try:
-                    raise ValueError(error_message)
-                except ValueError as e:
-                    logger.error("Test error occurred", exception=e)
-
-                # Restore stdout
-                sys.stdout = original_stdout
-                output = captured_output.getvalue()
-
-                # Parse log entry
-                log_entry = json.loads(output.strip())
-
-                # Property: Error log should include exception details
-                assert "exception" in log_entry, "Missing 'exception' field"
-                assert "type" in log_entry["exception"], "Missing exception 'type'"
-                assert "message" in log_entry["exception"], "Missing exception 'message'"
-                assert "stack_trace" in log_entry["exception"], "Missing exception 'stack_trace'"
-
-                # Property: Exception details should match
-                assert log_entry["exception"]["type"] == "ValueError"
-                assert error_message in log_entry["exception"]["message"]
-
-            finally:
-                sys.stdout = original_stdout
-        finally:
-            clear_trace()
+            raise ValueError(error_message)
+        except ValueError as e:
+            logger.error("Test error occurred", exception=e)
+
+        (log_entry,) = logger.records
+
+        # Property: Error log should include exception details
+        assert "exception" in log_entry, "Missing 'exception' field"
+        assert "type" in log_entry["exception"], "Missing exception 'type'"
+        assert "message" in log_entry["exception"], "Missing exception 'message'"
+        assert "stack_trace" in log_entry["exception"], "Missing exception 'stack_trace'"
+
+        # Property: Exception details should match
+        assert log_entry["exception"]["type"] == "ValueError"
+        assert error_message in log_entry["exception"]["message"]
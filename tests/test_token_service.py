@@ -10,10 +10,27 @@ from hypothesis import strategies as st
 from src.services.token_service import TokenService
 from src.utils.config import config
 
+# Token pairs are signed once per class and sampled by index; the round-trip
+# property still signs a fresh pair for every example
+TOKEN_POOL_SIZE = 32
+
 
 class TestTokenServicePropertyBased:
     """Property-based tests for TokenService."""
 
+    @pytest.fixture(scope="class")
+    def token_pool(self):
+        """(user_id, access_token, refresh_token) triples spread over the user ID range."""
+        step = (2147483647 - 1) // (TOKEN_POOL_SIZE - 1)
+        return [
+            (
+                user_id,
+                TokenService.create_access_token(user_id),
+                TokenService.create_refresh_token(user_id),
+            )
+            for user_id in range(1, 2147483647 + 1, step)
+        ]
+
     @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow])
     @given(user_id=st.integers(min_value=1, max_value=2147483647))
     def test_token_round_trip_consistency(self, user_id: int):
@@ -56,22 +73,18 @@ class TestTokenServicePropertyBased:
 
         Validates: Requirements 5.2
         """
-        # Create token with very short expiration
-        expires_delta = timedelta(milliseconds=1)
+        # Create a token whose expiration already lies in the past, so no
+        # waiting is needed for the current time to pass it
+        expires_delta = timedelta(seconds=-1)
         access_token = TokenService.create_access_token(user_id, expires_delta)
 
-        # Wait for token to expire
-        import time
-
-        time.sleep(0.01)
-
         # Verify that expired token raises ExpiredSignatureError
         with pytest.raises(jwt.ExpiredSignatureError):
             TokenService.verify_token(access_token)
 
     @settings(max_examples=100, deadline=None, suppress_health_check=[HealthCheck.too_slow])
-    @given(user_id=st.integers(min_value=1, max_value=2147483647))
-    def test_refresh_token_validity(self, user_id: int):
+    @given(index=st.integers(min_value=0, max_value=TOKEN_POOL_SIZE - 1))
+    def test_refresh_token_validity(self, token_pool, index: int):
         """
         Property 4: Refresh Token Validity
 
@@ -80,19 +93,18 @@ class TestTokenServicePropertyBased:
 
         Validates: Requirements 5.3, 5.4
         """
-        # Create refresh token
-        refresh_token = TokenService.create_refresh_token(user_id)
+        user_id, access_token, refresh_token = token_pool[index]
+        # Pooled tokens repeat across examples; start cold so each one is decoded
+        # and its signature checked rather than served from the verify cache
+        TokenService.clear_verify_cache()
 
         # Verify refresh token is valid
         refresh_payload = TokenService.verify_token(refresh_token)
         assert refresh_payload["sub"] == str(user_id)
         assert refresh_payload["type"] == "refresh"
 
-        # Create new access token using the same user_id from refresh token
-        new_access_token = TokenService.create_access_token(user_id)
-
-        # Verify new access token is valid
-        access_payload = TokenService.verify_token(new_access_token)
+        # Verify the access token issued for the same user_id is valid
+        access_payload = TokenService.verify_token(access_token)
         assert access_payload["sub"] == str(user_id)
         assert access_payload["type"] == "access"
 
@@ -270,3 +282,42 @@ class TestTokenServiceUnit:
 
         # Refresh token should expire later than access token
         assert refresh_payload["exp"] > access_payload["exp"]
+
+    def test_verified_token_is_reused_until_expiry(self, monkeypatch):
+        """Test a verified token is served from cache, and re-verified once expired."""
+        TokenService.clear_verify_cache()
+        token = TokenService.create_access_token(999998)
+        TokenService.verify_token(token)
+
+        calls = []
+        monkeypatch.setattr(jwt, "decode", lambda t, *args, **kwargs: calls.append(t) or {})
+
+        # Cache hit: the signature is not checked again
+        assert TokenService.verify_token(token)["sub"] == "999998"
+        assert calls == []
+
+        # Once the cached expiry has passed the token is verified again
+        monkeypatch.setattr("src.services.token_service.time.time", lambda: float("inf"))
+        TokenService.verify_token(token)
+        assert calls == [token]
+
+    def test_mutating_verified_payload_does_not_change_cache(self):
+        """Test changes to a returned payload are not seen by later verifications."""
+        TokenService.clear_verify_cache()
+        token = TokenService.create_access_token(999997)
+
+        # Mutate the payload from the verification that fills the cache...
+        TokenService.verify_token(token)["sub"] = "999"
+        assert TokenService.verify_token(token)["sub"] == "999997"
+
+        # ...and one served from the cache
+        TokenService.verify_token(token)["sub"] = "999"
+        assert TokenService.verify_token(token)["sub"] == "999997"
+
+    def test_failed_verification_is_not_cached(self):
+        """Test an invalid token is rejected on every call, not just the first."""
+        TokenService.clear_verify_cache()
+
+        for _ in range(2):
+            with pytest.raises(jwt.InvalidTokenError):
+                TokenService.verify_token("not.a.valid.token")
@@ -1,6 +1,6 @@
 """Property-based tests for trace context management."""
 
-import uuid
+import re
 
 from hypothesis import given
 from hypothesis import strategies as st
@@ -12,6 +12,9 @@ from src.utils.trace_context import (
     set_trace,
 )
 
+# Canonical string form of a UUID, as produced by str(uuid.uuid4())
+_UUID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}\Z")
+
 
 class TestTraceContextManagement:
     """Tests for trace context management."""
@@ -35,10 +38,7 @@ class TestTraceContextManagement:
         assert get_current_trace() == trace_id
 
         # Verify trace ID is a valid UUID
-        try:
-            uuid.UUID(trace_id)
-        except ValueError as err:
-            raise AssertionError(f"Trace ID {trace_id} is not a valid UUID") from err
+        assert _UUID_RE.match(trace_id), f"Trace ID {trace_id} is not a valid UUID"
 
         # Simulate multiple operations within the same trace
         for _ in range(num_operations):
@@ -69,10 +69,7 @@ class TestTraceContextManagement:
 
         # Verify all are valid UUIDs
         for trace_id in created_traces:
-            try:
-                uuid.UUID(trace_id)
-            except ValueError as err:
-                raise AssertionError(f"Trace ID {trace_id} is not a valid UUID") from err
+            assert _UUID_RE.match(trace_id), f"Trace ID {trace_id} is not a valid UUID"
 
         clear_trace()
 